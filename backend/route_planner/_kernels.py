@@ -0,0 +1,62 @@
+"""
+Numba-compiled kernels for the fuel optimizer's distance calculations.
+
+Compiled code is cached on disk (``cache=True``), so the compile cost is paid
+on the first call after a deploy rather than once per process. Kernels run
+serially: they are called from request threads, and Numba's default
+threading layer is not safe to enter from several threads at once.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+@njit(cache=True, fastmath=True)
+def nearest_route_point(
+    station_coords: np.ndarray, route_points: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the closest route point to every station.
+
+    For each station the haversine term is minimized over the route points,
+    and only the winner is converted into a distance.
+
+    Args:
+        station_coords: (m, 2) float64 array of station latitude/longitude
+        route_points: (n, 2) float64 array of route latitude/longitude, n > 0
+
+    Returns:
+        Tuple of (index of the nearest route point, distance to it in miles),
+        each an array with one entry per station
+    """
+    route_lat = np.radians(route_points[:, 0])
+    route_lng = np.radians(route_points[:, 1])
+    route_cos_lat = np.cos(route_lat)
+
+    m = station_coords.shape[0]
+    nearest = np.empty(m, np.int64)
+    distance = np.empty(m, np.float64)
+    for i in range(m):
+        lat = math.radians(station_coords[i, 0])
+        lng = math.radians(station_coords[i, 1])
+        cos_lat = math.cos(lat)
+
+        # The haversine term never exceeds 1, so 2 is a safe starting bound
+        best = 2.0
+        best_index = 0
+        for j in range(route_lat.shape[0]):
+            a = (
+                math.sin((route_lat[j] - lat) / 2) ** 2
+                + cos_lat * route_cos_lat[j] * math.sin((route_lng[j] - lng) / 2) ** 2
+            )
+            if a < best:
+                best = a
+                best_index = j
+
+        nearest[i] = best_index
+        distance[i] = 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(min(best, 1.0)))
+    return nearest, distance
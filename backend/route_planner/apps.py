@@ -6,3 +6,6 @@ class RoutePlannerConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "route_planner"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
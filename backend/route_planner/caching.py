@@ -0,0 +1,61 @@
+import logging
+from functools import wraps
+from typing import Callable, Optional
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+
+logger = logging.getLogger(__name__)
+
+# Generation stamp of the cached route list and detail pages. Pages are cached
+# under a key prefix containing the stamp, so replacing it invalidates every
+# page at once, on any cache backend, without scanning for keys.
+ROUTE_PAGE_GENERATION_KEY = "routes:generation"
+
+
+def route_page_generation() -> Optional[str]:
+    """Read the route page generation, creating one if it has been evicted."""
+    try:
+        generation = cache.get(ROUTE_PAGE_GENERATION_KEY)
+        if generation is None:
+            cache.add(ROUTE_PAGE_GENERATION_KEY, uuid4().hex, None)
+            generation = cache.get(ROUTE_PAGE_GENERATION_KEY)
+        return generation
+    except Exception as e:
+        logger.warning(f"Route page generation check failed: {str(e)}")
+        return None
+
+
+def invalidate_route_pages() -> None:
+    """Start a new route page generation, dropping every cached route page."""
+    try:
+        cache.set(ROUTE_PAGE_GENERATION_KEY, uuid4().hex, None)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed: {str(e)}")
+
+
+def cache_route_page(timeout: int) -> Callable:
+    """
+    Cache a route view's responses like ``cache_page``, per page generation.
+
+    Responses are served uncached while the generation cannot be read.
+
+    Args:
+        timeout: Seconds to cache each response for
+    """
+
+    def decorator(view_func: Callable) -> Callable:
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            generation = route_page_generation()
+            if generation is None:
+                return view_func(request, *args, **kwargs)
+            cached_view = cache_page(timeout, key_prefix=f"routes.{generation}")(
+                view_func
+            )
+            return cached_view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,38 @@
+import logging
+from typing import Any, Optional
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler as drf_exception_handler
+
+logger = logging.getLogger(__name__)
+
+
+def exception_handler(exc: Exception, context: dict[str, Any]) -> Optional[Response]:
+    """
+    Turn exceptions the views do not handle into a JSON 500 response.
+
+    Exceptions DRF knows about (validation errors, Http404, authentication
+    failures, ...) keep DRF's own handling. Anything else is logged with its
+    traceback and answered with ``{"error": ...}``. A view can word that
+    message per action through an ``unexpected_error_messages`` dict.
+
+    Args:
+        exc: The exception raised by the view
+        context: DRF handler context, including the view
+
+    Returns:
+        Response to send to the client
+    """
+    response = drf_exception_handler(exc, context)
+    if response is not None:
+        return response
+
+    view = context.get("view")
+    logger.exception(f"Unhandled error in {view.__class__.__name__}: {str(exc)}")
+
+    messages = getattr(view, "unexpected_error_messages", {})
+    message = messages.get(
+        getattr(view, "action", None), "An unexpected error occurred"
+    )
+    return Response({"error": message}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,42 +1,111 @@
-import csv
+import asyncio
+import contextlib
+import inspect
+import io
 import logging
 import os
+import random
+import struct
 import time
-from decimal import Decimal
 
-from typing import Any, Set, Tuple, Optional
+from typing import Any, Tuple, Optional, Union
 from functools import wraps
 
+import aiohttp
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import redis
+import requests
 from django.conf import settings
-from django.contrib.gis.geos import Point
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
 
+from ...caching import invalidate_route_pages
 from ...models import FuelStation
 from ...services import MapQuestService
+from ...station_index import invalidate_station_index
 
 logger = logging.getLogger(__name__)
 
 
-def retry_on_failure(retries=3, delay=1):
-    """Decorator to retry operations with exponential backoff."""
+def http_status(error: BaseException) -> Optional[int]:
+    """Get the HTTP status of a failed request, or None if no response came back."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code
+    return None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Check whether a failed request is worth retrying.
+
+    Connection errors, timeouts, rate limiting (429) and server errors (5xx)
+    are transient. Other HTTP errors, such as a rejected API key, and
+    everything else, such as the ValueError for an address MapQuest cannot
+    resolve, are not.
+    """
+    status = http_status(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(
+        error,
+        (
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            requests.ConnectionError,
+            requests.Timeout,
+        ),
+    )
+
+
+def retry_on_failure(retries=3, delay=1, max_delay=30):
+    """
+    Decorator to retry operations with jittered exponential backoff.
+
+    Works on both regular and ``async`` functions; coroutines wait with
+    ``asyncio.sleep`` so a retry never blocks the event loop. The jitter
+    keeps concurrent workers from retrying in lockstep after a shared failure.
+    Only errors accepted by ``is_transient_error`` are retried; others
+    propagate at once.
+    """
+
+    def backoff(attempt: int, error: Exception) -> float:
+        # Jittered exponential backoff, capped at max_delay
+        wait_time = min(delay * (2**attempt) * random.uniform(0.5, 1.5), max_delay)
+        logger.warning(
+            f"Attempt {attempt + 1}/{retries} failed: {str(error)}. "
+            f"Retrying in {wait_time:.1f} seconds..."
+        )
+        return wait_time
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt == retries - 1 or not is_transient_error(e):
+                            raise
+                        await asyncio.sleep(backoff(attempt, e))
+                return None
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             for attempt in range(retries):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    if attempt == retries - 1:  # Last attempt
+                    if attempt == retries - 1 or not is_transient_error(e):
                         raise
-                    wait_time = delay * (2**attempt)  # Exponential backoff
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{retries} failed: {str(e)}. "
-                        f"Retrying in {wait_time} seconds..."
-                    )
-                    time.sleep(wait_time)
+                    time.sleep(backoff(attempt, e))
             return None
 
         return wrapper
@@ -44,6 +113,187 @@ def retry_on_failure(retries=3, delay=1):
     return decorator
 
 
+# Geocode cache: one Redis hash of address -> (lat, lng) packed as little-endian
+# doubles (16 bytes). The TTL covers the whole hash and is refreshed on every
+# write, so entries live until a day after the last import touched the cache.
+GEOCODE_CACHE_KEY = "geocode:cache"
+GEOCODE_CACHE_TIMEOUT = 86400  # 24 hours
+COORDINATES = struct.Struct("<dd")
+
+# CSV columns in the order of the FuelStation fields they populate
+STATION_COLUMNS = (
+    "OPIS Truckstop ID",
+    "Truckstop Name",
+    "Address",
+    "City",
+    "State",
+    "Rack ID",
+    "Retail Price",
+)
+
+# IDs match the int4 IntegerField columns they are copied into. Text columns
+# are typed too: Arrow would otherwise infer null for an empty file, or int64
+# for a column that happens to hold only digits
+STATION_COLUMN_TYPES = {
+    "OPIS Truckstop ID": pa.int32(),
+    "Truckstop Name": pa.string(),
+    "Address": pa.string(),
+    "City": pa.string(),
+    "State": pa.string(),
+    "Rack ID": pa.int32(),
+    "Retail Price": pa.decimal128(12, 8),
+}
+
+
+def read_stations_csv(csv_file: str) -> pa.Table:
+    """
+    Parse the OPIS CSV into an Arrow table with one row per station.
+
+    The file is tokenized and typed by Arrow's multithreaded C++ reader: IDs
+    are parsed as int32 and retail prices as exact decimal128 values, so no
+    per-row Python conversion is needed. Only ``STATION_COLUMNS`` are
+    converted; any other columns in the file are skipped. Rows repeating an
+    earlier station ID are dropped, keeping the first occurrence.
+    """
+    table = pacsv.read_csv(
+        csv_file,
+        parse_options=pacsv.ParseOptions(delimiter=","),
+        convert_options=pacsv.ConvertOptions(
+            column_types=STATION_COLUMN_TYPES,
+            include_columns=list(STATION_COLUMNS),
+        ),
+    )
+
+    station_ids = table.column("OPIS Truckstop ID")
+    first_rows = pc.index_in(pc.unique(station_ids), value_set=station_ids)
+    return table.take(first_rows)
+
+
+def copy_stations(stations: pa.Table, update_existing: bool = False) -> int:
+    """
+    Insert stations with COPY, skipping or updating station IDs that exist.
+
+    The table is serialized to CSV by Arrow's writer and streamed into a
+    temporary staging table, then moved across with a single
+    ``INSERT ... SELECT ... ON CONFLICT (station_id)``, since COPY itself
+    cannot handle conflicting rows. Columns must be ``STATION_COLUMNS``
+    followed by the location as EWKT. Must be called inside a transaction;
+    the staging table is dropped on commit.
+
+    Args:
+        stations: Stations to store
+        update_existing: Overwrite stations that already exist instead of
+            skipping them
+
+    Returns:
+        Number of stations inserted or updated
+    """
+    buffer = io.BytesIO()
+    pacsv.write_csv(
+        stations, buffer, write_options=pacsv.WriteOptions(include_header=False)
+    )
+    buffer.seek(0)
+
+    table = FuelStation._meta.db_table
+    column_names = (
+        "station_id",
+        "name",
+        "address",
+        "city",
+        "state",
+        "rack_id",
+        "retail_price",
+        "location",
+    )
+    columns = ", ".join(column_names)
+
+    if update_existing:
+        conflict_action = "DO UPDATE SET " + ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in column_names[1:] + ("updated_at",)
+        )
+    else:
+        conflict_action = "DO NOTHING"
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE fuelstation_import ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        cursor.copy_expert(
+            f"COPY fuelstation_import ({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}, created_at, updated_at) "
+            f"SELECT {columns}, now(), now() FROM fuelstation_import "
+            f"ON CONFLICT (station_id) {conflict_action}"
+        )
+        return cursor.rowcount
+
+
+# Statuses meaning the batch endpoint itself is missing, so single-address
+# requests may still work
+BATCH_UNAVAILABLE_STATUSES = frozenset({404, 405, 501})
+
+
+async def gather_with_sem(
+    map_quest: "EnhancedMapQuestService", addresses: list[str], concurrency: int
+) -> list[Union[Tuple[float, float], BaseException]]:
+    """
+    Geocode addresses concurrently over a shared keep-alive session.
+
+    Addresses are sent in chunks of ``map_quest.batch_limit`` to MapQuest's
+    batch endpoint. A chunk is retried one address at a time only when the
+    batch endpoint is unavailable or answers with a malformed response; any
+    other failure, such as a rejected API key or exhausted quota, is raised
+    and stops the import. At most ``concurrency`` requests are in flight at
+    once so the import stays within MapQuest's rate limits. Results are
+    returned in the same order as ``addresses``; failed lookups are returned
+    as the exception.
+    The semaphore is held for each HTTP attempt only, never across a retry's
+    backoff, so a few failing requests cannot starve the rest.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def bounded_geocode_batch(
+            chunk: list[str],
+        ) -> list[Union[Tuple[float, float], BaseException]]:
+            try:
+                return await map_quest.geocode_batch_async(
+                    session, chunk, semaphore=semaphore
+                )
+            except (ValueError, aiohttp.ContentTypeError) as e:
+                reason = f"malformed batch response: {str(e)}"
+            except aiohttp.ClientResponseError as e:
+                if e.status not in BATCH_UNAVAILABLE_STATUSES:
+                    raise
+                reason = f"batch endpoint unavailable ({e.status})"
+            logger.warning(
+                f"Batch geocoding failed: {reason}. "
+                f"Falling back to single requests for {len(chunk)} addresses."
+            )
+            return await asyncio.gather(
+                *(
+                    map_quest.geocode_async(session, address, semaphore=semaphore)
+                    for address in chunk
+                ),
+                return_exceptions=True,
+            )
+
+        chunks = [
+            addresses[i : i + map_quest.batch_limit]
+            for i in range(0, len(addresses), map_quest.batch_limit)
+        ]
+        chunk_results = await asyncio.gather(
+            *(bounded_geocode_batch(chunk) for chunk in chunks)
+        )
+        return [result for results in chunk_results for result in results]
+
+
 class EnhancedMapQuestService(MapQuestService):
     """Enhanced MapQuest service with Redis caching and fallback behavior."""
 
@@ -71,35 +321,62 @@ class EnhancedMapQuestService(MapQuestService):
             )
             self.cache_enabled = False
 
-    def get_cache_key(self, address: str) -> str:
-        """Generate a cache key for an address."""
-        return f"geocode:{address}"
-
     def get_from_cache(self, address: str) -> Optional[Tuple[float, float]]:
         """Retrieve geocoding results from cache."""
         if not self.cache_enabled:
             return None
 
         try:
-            cached = self.redis_client.get(self.get_cache_key(address))
+            cached = self.redis_client.hget(GEOCODE_CACHE_KEY, address)
             if cached:
-                lat, lng = cached.decode().split(",")
-                return float(lat), float(lng)
-        except (redis.RedisError, ValueError) as e:
+                return COORDINATES.unpack(cached)
+        except (redis.RedisError, struct.error) as e:
             logger.warning(f"Cache retrieval failed for {address}: {str(e)}")
         return None
 
     def save_to_cache(self, address: str, coordinates: Tuple[float, float]) -> None:
         """Save geocoding results to cache."""
-        if not self.cache_enabled:
+        self.save_many({address: coordinates})
+
+    def get_many(self, addresses: list[str]) -> dict[str, Tuple[float, float]]:
+        """Retrieve cached geocoding results for many addresses in one round-trip."""
+        if not self.cache_enabled or not addresses:
+            return {}
+
+        try:
+            values = self.redis_client.hmget(GEOCODE_CACHE_KEY, addresses)
+        except redis.RedisError as e:
+            logger.warning(f"Bulk cache retrieval failed: {str(e)}")
+            return {}
+
+        found: dict[str, Tuple[float, float]] = {}
+        for address, cached in zip(addresses, values):
+            if not cached:
+                continue
+            try:
+                found[address] = COORDINATES.unpack(cached)
+            except struct.error as e:
+                logger.warning(f"Cache retrieval failed for {address}: {str(e)}")
+        return found
+
+    def save_many(self, mapping: dict[str, Tuple[float, float]]) -> None:
+        """Save many geocoding results to cache in a single pipelined round-trip."""
+        if not self.cache_enabled or not mapping:
             return
 
         try:
-            cache_key = self.get_cache_key(address)
-            cache_value = f"{coordinates[0]},{coordinates[1]}"
-            self.redis_client.setex(cache_key, 86400, cache_value)  # Cache for 24 hours
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hset(
+                GEOCODE_CACHE_KEY,
+                mapping={
+                    address: COORDINATES.pack(*coordinates)
+                    for address, coordinates in mapping.items()
+                },
+            )
+            pipe.expire(GEOCODE_CACHE_KEY, GEOCODE_CACHE_TIMEOUT)
+            pipe.execute()
         except redis.RedisError as e:
-            logger.warning(f"Cache save failed for {address}: {str(e)}")
+            logger.warning(f"Bulk cache save failed: {str(e)}")
 
     @retry_on_failure(retries=3, delay=1)
     def geocode(self, address: str) -> Tuple[float, float]:
@@ -117,6 +394,55 @@ class EnhancedMapQuestService(MapQuestService):
 
         return coordinates
 
+    @retry_on_failure(retries=3, delay=1)
+    async def geocode_batch_async(
+        self,
+        session: aiohttp.ClientSession,
+        addresses: list[str],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> list[Union[Tuple[float, float], ValueError]]:
+        """
+        Geocode up to ``batch_limit`` addresses in one request to the batch endpoint.
+
+        See ``MapQuestService.geocode_batch`` for the shape of the result. If
+        given, ``semaphore`` is held for the duration of each HTTP attempt.
+        """
+        async with semaphore or contextlib.nullcontext():
+            async with session.post(
+                self._geocode_batch_url,
+                params={"key": self.api_key},
+                json=self._geocode_batch_body(addresses),
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
+
+        return self._parse_geocode_batch_result(result, addresses)
+
+    @retry_on_failure(retries=3, delay=1)
+    async def geocode_async(
+        self,
+        session: aiohttp.ClientSession,
+        address: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Tuple[float, float]:
+        """
+        Geocode an address through a shared aiohttp session.
+
+        Results are not cached here; callers batch them into ``save_many``.
+        If given, ``semaphore`` is held for the duration of each HTTP attempt.
+        """
+        async with semaphore or contextlib.nullcontext():
+            async with session.get(
+                self._geocode_url,
+                params={"key": self.api_key, "location": address},
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
+
+        return self._parse_geocode_result(result, address)
+
 
 class Command(BaseCommand):
     """
@@ -139,109 +465,132 @@ class Command(BaseCommand):
             help="Force reload data even if already present",
         )
         parser.add_argument(
-            "--batch-size",
+            "--concurrency",
             type=int,
-            default=100,
-            help="Number of records to process in each batch",
+            default=8,
+            help="Maximum number of concurrent geocoding requests",
         )
 
     def handle(self, *args: Any, **options: dict[str, Any]) -> None:
         """Handle the command execution with enhanced error handling."""
         csv_file = options["csv_file"]
         force = options.get("force", False)
-        batch_size = options.get("batch_size", 100)
+        concurrency = options.get("concurrency", 8)
 
         if not os.path.exists(csv_file):
             self.stdout.write(self.style.ERROR(f"CSV file not found: {csv_file}"))
             return
 
-        existing_count = FuelStation.objects.count()
-        if existing_count > 0 and not force:
+        if not force and FuelStation.objects.exists():
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"Fuel station data already loaded ({existing_count} stations). "
-                    "Use --force to reload."
+                    "Fuel station data already loaded. Use --force to reload."
                 )
             )
             return
 
         map_quest = EnhancedMapQuestService()
-        processed_ids: Set[int] = set()
         failed_records: list[dict[str, Any]] = []
-        success_count = 0
 
         try:
-            with transaction.atomic():
-                with open(csv_file, "r", encoding="utf-8") as file:
-                    reader = csv.dictReader(file)
-                    stations_to_create = []
-
-                    for row in reader:
-                        station_id = int(row["OPIS Truckstop ID"])
-
-                        if station_id in processed_ids:
-                            continue
-
-                        processed_ids.add(station_id)
-                        address = f"{row['Address']}, {row['City']}, {row['State']}"
-
-                        try:
-                            lat, lng = map_quest.geocode(address)
-
-                            station = FuelStation(
-                                station_id=station_id,
-                                name=row["Truckstop Name"],
-                                address=row["Address"],
-                                city=row["City"],
-                                state=row["State"],
-                                rack_id=int(row["Rack ID"]),
-                                retail_price=Decimal(row["Retail Price"]),
-                                location=Point(lng, lat),
-                            )
-                            stations_to_create.append(station)
-                            success_count += 1
-
-                            if len(stations_to_create) >= batch_size:
-                                FuelStation.objects.bulk_create(stations_to_create)
-                                self.stdout.write(
-                                    f"Processed {success_count} stations..."
-                                )
-                                stations_to_create = []
-
-                        except Exception as e:
-                            logger.error(
-                                f"Error processing station {station_id}: {str(e)}"
-                            )
-                            failed_records.append(
-                                {
-                                    "station_id": station_id,
-                                    "address": address,
-                                    "error": str(e),
-                                }
-                            )
-                            continue
-
-                    # Create remaining stations
-                    if stations_to_create:
-                        FuelStation.objects.bulk_create(stations_to_create)
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Successfully loaded {success_count} stations. "
-                        f"Failed to process {len(failed_records)} stations."
+            # Without --force the table is empty here, so every row is new; with
+            # it every row is written, overwriting the stored station
+            table = read_stations_csv(csv_file)
+
+            station_ids = table.column("OPIS Truckstop ID").to_pylist()
+            address_column = pc.binary_join_element_wise(
+                table.column("Address"),
+                table.column("City"),
+                table.column("State"),
+                ", ",
+            )
+            addresses = address_column.to_pylist()
+            unique_addresses = pc.unique(address_column).to_pylist()
+
+            # Serve what we can from the cache, then geocode the rest concurrently
+            coordinates: dict[str, Union[Tuple[float, float], BaseException]] = {}
+            coordinates.update(map_quest.get_many(unique_addresses))
+
+            pending = [
+                address for address in unique_addresses if address not in coordinates
+            ]
+            if pending:
+                results = asyncio.run(gather_with_sem(map_quest, pending, concurrency))
+                coordinates.update(zip(pending, results))
+                self.stdout.write(f"Geocoded {len(pending)} addresses...")
+                map_quest.save_many(
+                    {
+                        address: result
+                        for address, result in zip(pending, results)
+                        if not isinstance(result, BaseException)
+                    }
+                )
+
+            located_rows: list[int] = []
+            locations: list[Tuple[float, float]] = []
+            for i, (station_id, address) in enumerate(zip(station_ids, addresses)):
+                result = coordinates[address]
+                if isinstance(result, BaseException):
+                    logger.error(
+                        f"Error processing station {station_id}: {str(result)}"
                     )
+                    failed_records.append(
+                        {
+                            "station_id": station_id,
+                            "address": address,
+                            "error": str(result),
+                        }
+                    )
+                    continue
+
+                located_rows.append(i)
+                locations.append(result)
+
+            # Attach the coordinates as an EWKT column; the station columns stay
+            # in Arrow all the way to COPY
+            lats = pc.cast(
+                pa.array([lat for lat, _ in locations], pa.float64()), pa.string()
+            )
+            lngs = pc.cast(
+                pa.array([lng for _, lng in locations], pa.float64()), pa.string()
+            )
+            stations = (
+                table.take(pa.array(located_rows, pa.int64()))
+                .select(list(STATION_COLUMNS))
+                .append_column(
+                    "location",
+                    pc.binary_join_element_wise(
+                        "SRID=4326;POINT(", lngs, " ", lats, ")", ""
+                    ),
+                )
+            )
+
+            # Only the insert runs inside the transaction; geocoding happened above
+            with transaction.atomic():
+                success_count = copy_stations(stations, update_existing=force)
+
+            # COPY bypasses model signals, so invalidate the station index and
+            # the route pages embedding station data here
+            invalidate_station_index()
+            invalidate_route_pages()
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully loaded {success_count} stations. "
+                    f"Failed to process {len(failed_records)} stations."
                 )
+            )
 
-                if failed_records:
-                    self.stdout.write("\nFailed records:")
-                    for record in failed_records:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Station ID: {record['station_id']}, "
-                                f"Address: {record['address']}, "
-                                f"Error: {record['error']}"
-                            )
+            if failed_records:
+                self.stdout.write("\nFailed records:")
+                for record in failed_records:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"Station ID: {record['station_id']}, "
+                            f"Address: {record['address']}, "
+                            f"Error: {record['error']}"
                         )
+                    )
 
         except Exception as e:
             self.stdout.write(
@@ -0,0 +1,3 @@
+"""``loadfueldata``: alias of the ``import_stations`` command."""
+
+from .import_stations import Command  # noqa: F401
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.23 on 2026-10-15 09:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('route_planner', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='fuelstation',
+            name='route_plann_state_a5d78a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='fuelstation',
+            index=models.Index(fields=['state', 'retail_price'], name='route_plann_state_7e1fff_idx'),
+        ),
+    ]
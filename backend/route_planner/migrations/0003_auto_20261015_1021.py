@@ -0,0 +1,21 @@
+# Generated by Django 3.2.23 on 2026-10-15 10:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('route_planner', '0002_auto_20261015_0914'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='route',
+            name='route_plann_created_95c3af_idx',
+        ),
+        migrations.AddIndex(
+            model_name='route',
+            index=models.Index(fields=['created_at', 'id'], name='route_plann_created_6dbe62_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.23 on 2026-10-15 11:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_fuel_stops(apps, schema_editor):
+    """Create RouteStop rows from every route's fuel_stops array."""
+    FuelStation = apps.get_model('route_planner', 'FuelStation')
+    Route = apps.get_model('route_planner', 'Route')
+    RouteStop = apps.get_model('route_planner', 'RouteStop')
+
+    # fuel_stops holds OPIS station IDs; RouteStop points at primary keys
+    station_pks = dict(FuelStation.objects.values_list('station_id', 'pk'))
+    RouteStop.objects.bulk_create(
+        [
+            RouteStop(route_id=route_pk, station_id=station_pks[station_id], order=order)
+            for route_pk, fuel_stops in Route.objects.values_list('pk', 'fuel_stops').iterator()
+            for order, station_id in enumerate(fuel_stops)
+            if station_id in station_pks
+        ],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('route_planner', '0003_auto_20261015_1021'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RouteStop',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order', models.PositiveSmallIntegerField()),
+                ('route', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stops', to='route_planner.route')),
+                ('station', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='route_stops', to='route_planner.fuelstation')),
+            ],
+            options={
+                'ordering': ['order'],
+            },
+        ),
+        migrations.AddField(
+            model_name='route',
+            name='stations',
+            field=models.ManyToManyField(related_name='routes', through='route_planner.RouteStop', to='route_planner.FuelStation'),
+        ),
+        migrations.AddConstraint(
+            model_name='routestop',
+            constraint=models.UniqueConstraint(fields=('route', 'order'), name='unique_route_stop_order'),
+        ),
+        migrations.RunPython(copy_fuel_stops, migrations.RunPython.noop),
+    ]
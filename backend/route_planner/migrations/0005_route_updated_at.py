@@ -0,0 +1,23 @@
+# Generated by Django 3.2.23 on 2026-10-15 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('route_planner', '0004_routestop'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='route',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        # Existing routes have not changed since they were created
+        migrations.RunSQL(
+            'UPDATE route_planner_route SET updated_at = created_at',
+            migrations.RunSQL.noop,
+        ),
+    ]
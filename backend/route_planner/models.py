@@ -31,9 +31,10 @@ class FuelStation(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-
+        # location already has a GiST index: PointField sets spatial_index=True.
+        # The (state, retail_price) index also serves lookups on state alone.
         indexes = [
-            models.Index(fields=["state"]),
+            models.Index(fields=["state", "retail_price"]),
             models.Index(fields=["retail_price"]),
         ]
 
@@ -51,10 +52,13 @@ class Route(models.Model):
         start_coords: Geographic point of start location
         end_coords: Geographic point of end location
         total_distance: Total route distance in miles
-        total_fuel_cost: Calculated total cost of fuel for the trip
-        fuel_stops: Array of FuelStation IDs representing optimal fuel stops
+        total_fuel_cost: Calculated total cost of fuel for the trip, rounded to cents
+        fuel_stops: Array of FuelStation IDs representing optimal fuel stops;
+            superseded by ``stations`` and kept in sync during the transition
+        stations: Fuel stops as FuelStation rows, in stop order via RouteStop
         route_polyline: Encoded polyline of the route for map display
         created_at: Timestamp of when the route was created
+        updated_at: Timestamp of when the route was last updated
     """
 
     start_location = models.CharField(max_length=255)
@@ -64,13 +68,46 @@ class Route(models.Model):
     total_distance = models.DecimalField(max_digits=8, decimal_places=2)
     total_fuel_cost = models.DecimalField(max_digits=8, decimal_places=2)
     fuel_stops = ArrayField(models.IntegerField())
+    stations = models.ManyToManyField(
+        FuelStation, through="RouteStop", related_name="routes"
+    )
     route_polyline = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # Serves the route list's created_at cursor and its (created_at, id) order
         indexes = [
-            models.Index(fields=["created_at"]),
+            models.Index(fields=["created_at", "id"]),
         ]
 
     def __str__(self) -> str:
         return f"Route from {self.start_location} to {self.end_location}"
+
+
+class RouteStop(models.Model):
+    """
+    A fuel stop on a route.
+
+    Attributes:
+        route: Route the stop belongs to
+        station: Fuel station to stop at
+        order: Position of the stop along the route, starting at 0
+    """
+
+    route = models.ForeignKey(Route, on_delete=models.CASCADE, related_name="stops")
+    station = models.ForeignKey(
+        FuelStation, on_delete=models.PROTECT, related_name="route_stops"
+    )
+    order = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ["order"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["route", "order"], name="unique_route_stop_order"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Stop {self.order} on {self.route}: {self.station}"
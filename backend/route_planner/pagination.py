@@ -0,0 +1,18 @@
+from rest_framework.pagination import CursorPagination
+
+
+class RouteCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the route list.
+
+    DRF filters on the first ordering field only. The cursor holds a
+    ``created_at`` position and an offset, and each page is fetched with
+    ``WHERE created_at < position ORDER BY created_at DESC, id DESC OFFSET n``
+    through the (created_at, id) index. The offset only skips rows already
+    returned that share a timestamp, and ``id`` keeps those rows in a stable
+    order. Each page costs about the same however deep the client has paged,
+    and no COUNT(*) is ever run.
+    """
+
+    page_size = 50
+    ordering = ("-created_at", "-id")
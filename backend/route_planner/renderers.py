@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Drop-in replacement for DRF's JSONRenderer that encodes in C. Values orjson
+    does not handle natively (such as Decimal or lazy translation strings) are
+    rendered through ``str``, which matches DRF's default output for them.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[dict[str, Any]] = None,
+    ) -> bytes:
+        """Render ``data`` into JSON bytes."""
+        if data is None:
+            return b""
+
+        return orjson.dumps(data, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -1,8 +1,48 @@
+from operator import attrgetter
 from typing import Any
 
+from django.db.models import (
+    FloatField,
+    Func,
+    Prefetch,
+    QuerySet,
+    prefetch_related_objects,
+)
 from rest_framework import serializers
 
-from .models import FuelStation, Route
+from .models import FuelStation, Route, RouteStop
+
+
+def fuel_station_queryset() -> QuerySet:
+    """
+    Stations queryset for serialization as fuel stops.
+
+    Only the columns read by FuelStationSerializer are selected, so
+    rack_id and the timestamps are never pulled from the database. The
+    coordinates are projected by PostGIS as plain floats (``lat``/``lng``)
+    rather than loading the geometry and building a GEOS Point per row.
+    """
+    return FuelStation.objects.only(
+        "station_id", "name", "address", "city", "state", "retail_price"
+    ).annotate(
+        lat=Func("location", function="ST_Y", output_field=FloatField()),
+        lng=Func("location", function="ST_X", output_field=FloatField()),
+    )
+
+
+def route_stops_prefetch() -> Prefetch:
+    """
+    Prefetch a route's stops, in order, with their stations.
+
+    Costs two queries however many routes are fetched: one for the stops and
+    one for their stations.
+    """
+    return Prefetch(
+        "stops",
+        queryset=RouteStop.objects.order_by("order").prefetch_related(
+            Prefetch("station", queryset=fuel_station_queryset())
+        ),
+    )
 
 
 class FuelStationSerializer(serializers.ModelSerializer):
@@ -30,12 +70,14 @@ class FuelStationSerializer(serializers.ModelSerializer):
         ]
 
     def get_latitude(self, obj: FuelStation) -> float:
-        """Extract latitude from the location field."""
-        return obj.location.y
+        """Extract latitude, preferring the value annotated by the database."""
+        lat = getattr(obj, "lat", None)
+        return lat if lat is not None else obj.location.y
 
     def get_longitude(self, obj: FuelStation) -> float:
-        """Extract longitude from the location field."""
-        return obj.location.x
+        """Extract longitude, preferring the value annotated by the database."""
+        lng = getattr(obj, "lng", None)
+        return lng if lng is not None else obj.location.x
 
 
 class RouteRequestSerializer(serializers.Serializer):
@@ -61,12 +103,35 @@ class RouteRequestSerializer(serializers.Serializer):
         return data
 
 
+class RouteSummarySerializer(serializers.ModelSerializer):
+    """
+    Serializer for the route list.
+
+    Leaves out the fuel stops and the polyline, which dominate the size of
+    a route, so listing routes stays cheap. Querysets should be narrowed
+    with ``.only(*RouteSummarySerializer.Meta.fields)``.
+    """
+
+    class Meta:
+        model = Route
+        fields = [
+            "id",
+            "start_location",
+            "end_location",
+            "total_distance",
+            "total_fuel_cost",
+            "created_at",
+        ]
+
+
 class RouteResponseSerializer(serializers.ModelSerializer):
     """
     Serializer for route calculation responses.
 
     Converts calculated Route instances to JSON format, including all
-    necessary information about the route and fuel stops.
+    necessary information about the route and fuel stops. When serializing
+    many routes, prefetch ``route_stops_prefetch()`` on the queryset to
+    avoid two queries per route.
     """
 
     fuel_stops = serializers.SerializerMethodField()
@@ -74,6 +139,7 @@ class RouteResponseSerializer(serializers.ModelSerializer):
     class Meta:
         model = Route
         fields = [
+            "id",
             "start_location",
             "end_location",
             "total_distance",
@@ -83,6 +149,63 @@ class RouteResponseSerializer(serializers.ModelSerializer):
         ]
 
     def get_fuel_stops(self, obj: Route) -> list[dict[str, Any]]:
-        """Retrieve and format fuel stop information."""
-        stations = FuelStation.objects.filter(station_id__in=obj.fuel_stops)
-        return FuelStationSerializer(stations, many=True).data
+        """Retrieve and format fuel stop information, in stop order."""
+        # No-op when the stops were already prefetched
+        prefetch_related_objects([obj], route_stops_prefetch())
+        return FuelStationSerializer(
+            [stop.station for stop in obj.stops.all()], many=True
+        ).data
+
+
+_ROUTE_FIELDS = attrgetter(
+    "id",
+    "start_location",
+    "end_location",
+    "total_distance",
+    "total_fuel_cost",
+    "route_polyline",
+)
+_STOP_FIELDS = attrgetter(
+    "station_id", "name", "address", "city", "state", "retail_price", "lat", "lng"
+)
+
+
+def route_response_data(route: Route) -> dict[str, Any]:
+    """
+    Build the RouteResponseSerializer representation of a route directly.
+
+    Used on the route creation hot path, where it skips DRF's per-field
+    serializer machinery. The output must stay identical to
+    ``RouteResponseSerializer(route).data``, including the decimal places
+    DRF renders for each DecimalField.
+    """
+    prefetch_related_objects([route], route_stops_prefetch())
+    route_id, start, end, distance, fuel_cost, polyline = _ROUTE_FIELDS(route)
+
+    fuel_stops = []
+    for stop in route.stops.all():
+        station_id, name, address, city, state, price, lat, lng = _STOP_FIELDS(
+            stop.station
+        )
+        fuel_stops.append(
+            {
+                "station_id": station_id,
+                "name": name,
+                "address": address,
+                "city": city,
+                "state": state,
+                "retail_price": f"{price:.3f}",
+                "latitude": lat,
+                "longitude": lng,
+            }
+        )
+
+    return {
+        "id": route_id,
+        "start_location": start,
+        "end_location": end,
+        "total_distance": f"{distance:.2f}",
+        "total_fuel_cost": f"{fuel_cost:.2f}",
+        "fuel_stops": fuel_stops,
+        "route_polyline": polyline,
+    }
@@ -1,15 +1,26 @@
 from decimal import Decimal
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple, Union
 import logging
+import math
+import pickle
+import threading
+from collections import OrderedDict
 from functools import wraps
+from hashlib import blake2b
 
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
 from django.contrib.gis.geos import Point
+from django.core.exceptions import ValidationError
 from django.core.cache import cache
+from django.db import transaction
 
-from .models import FuelStation, Route
+from ._kernels import EARTH_RADIUS_MILES, nearest_route_point
+from .models import FuelStation, Route, RouteStop
+from .station_index import station_index
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +33,22 @@ def cache_safe(func):
 
     @wraps(func)
     def wrapper(*args, **kwargs):
+        try:
+            # Hash the arguments (minus self) instead of embedding their repr
+            key_material = pickle.dumps(args[1:], protocol=5) + pickle.dumps(
+                sorted(kwargs.items()), protocol=5
+            )
+            cache_key = (
+                f"{func.__name__}:{blake2b(key_material, digest_size=16).hexdigest()}"
+            )
+        except Exception as e:
+            logger.warning(f"Cache key creation failed: {str(e)}. Skipping cache.")
+            return func(*args, **kwargs)
+
         try:
             # Try to get from cache first
-            cache_key = f"{func.__name__}_{str(args[1:])}"
             cached_result = cache.get(cache_key)
-            if cached_result:
+            if cached_result is not None:
                 return cached_result
         except Exception as e:
             logger.warning(
@@ -47,18 +69,77 @@ def cache_safe(func):
     return wrapper
 
 
+def _build_session() -> requests.Session:
+    """
+    Build the HTTP session shared by every MapQuestService.
+
+    The connection pool keeps TCP and TLS connections to MapQuest alive
+    across requests, and transient failures (connection errors and 502, 503
+    and 504 responses) are retried with exponential backoff by urllib3.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        # Batch geocoding is a POST, but it is a read-only lookup
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Services are created per request; they all share one connection pool
+_SESSION = _build_session()
+
+
+def normalize_address(address: str) -> str:
+    """
+    Lowercase an address and collapse its whitespace.
+
+    Trivially different spellings of the same address then share one cache
+    entry.
+    """
+    return " ".join(address.lower().split())
+
+
+def route_cache_key(start: str, end: str) -> str:
+    """Build the cache key for a planned route response."""
+    normalized = f"{normalize_address(start)}|{normalize_address(end)}"
+    return f"route:{blake2b(normalized.encode(), digest_size=16).hexdigest()}"
+
+
 class MapQuestService:
     """
     Service for interacting with the MapQuest API.
 
     Handles route calculations and geocoding using MapQuest's API services.
     Includes fault-tolerant caching and comprehensive error handling.
+    Transient HTTP failures are retried by the shared session.
     """
 
     def __init__(self) -> None:
         self.api_key = settings.MAP_QUEST_API_KEY
         self.base_url = settings.MAP_QUEST_URL
-        self.retries = 3  # Number of retries for API calls
+
+        # Endpoints and the request parameters that never change between calls
+        self._route_url = f"{self.base_url}/directions/v2/route"
+        self._geocode_url = f"{self.base_url}/geocoding/v1/address"
+        self._geocode_batch_url = f"{self.base_url}/geocoding/v1/batch"
+        self.batch_limit = 100  # Maximum locations per batch geocoding request
+        self._route_base_params = {
+            "key": self.api_key,
+            "routeType": "fastest",
+            "fullShape": True,
+        }
+        self.timeout = (2, 5)  # (connect, read) seconds
+
+        self.session = _SESSION
 
     @cache_safe
     def get_route(self, start: str, end: str) -> dict[str, Any]:
@@ -76,47 +157,33 @@ class MapQuestService:
             ValueError: If the API returns invalid or missing data
             requests.RequestException: If the API request fails
         """
-        for attempt in range(self.retries):
-            try:
-                response = requests.get(
-                    f"{self.base_url}/directions/v2/route",
-                    params={
-                        "key": self.api_key,
-                        "from": start,
-                        "to": end,
-                        "routeType": "fastest",
-                        "fullShape": True,
-                    },
-                    timeout=10,
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                # Validate response structure
-                if "route" not in result or "shape" not in result["route"]:
-                    raise ValueError("Invalid response structure from MapQuest API")
+        try:
+            response = self.session.get(
+                self._route_url,
+                params={**self._route_base_params, "from": start, "to": end},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Failed to get route: {str(e)}")
+            raise
 
-                return result
+        result = response.json()
 
-            except requests.RequestException as e:
-                if attempt == self.retries - 1:  # Last attempt
-                    logger.error(
-                        f"Failed to get route after {self.retries} attempts: {str(e)}"
-                    )
-                    raise
-                logger.warning(
-                    f"Route calculation attempt {attempt + 1} failed: {str(e)}"
-                )
+        # Validate response structure
+        if "route" not in result or "shape" not in result["route"]:
+            raise ValueError("Invalid response structure from MapQuest API")
 
-            except Exception as e:
-                logger.error(f"Unexpected error in get_route: {str(e)}")
-                raise
+        return result
 
-    @cache_safe
     def geocode(self, address: str) -> Tuple[float, float]:
         """
         Convert address to coordinates using MapQuest API.
 
+        Results are memoized in-process by normalized address, in front of
+        the shared cache, so repeated addresses cost a dict lookup. The
+        address is sent to MapQuest as given.
+
         Args:
             address: Location address to geocode
 
@@ -127,40 +194,116 @@ class MapQuestService:
             ValueError: If geocoding fails or returns invalid data
             requests.RequestException: If the API request fails
         """
-        for attempt in range(self.retries):
+        coordinates = geocode_memo.get(address)
+        if coordinates is None:
+            coordinates = self._geocode(address)
+            geocode_memo.set(address, coordinates)
+        return coordinates
+
+    @cache_safe
+    def _geocode(self, address: str) -> Tuple[float, float]:
+        """Geocode an address with a MapQuest API request."""
+        try:
+            response = self.session.get(
+                self._geocode_url,
+                params={"key": self.api_key, "location": address},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Failed to geocode {address}: {str(e)}")
+            raise
+
+        return self._parse_geocode_result(response.json(), address)
+
+    def geocode_batch(
+        self, addresses: list[str]
+    ) -> list[Union[Tuple[float, float], ValueError]]:
+        """
+        Geocode up to ``batch_limit`` addresses with a single API request.
+
+        Args:
+            addresses: Location addresses to geocode
+
+        Returns:
+            One entry per address, in order: a (latitude, longitude) tuple, or
+            a ValueError describing why that address could not be geocoded
+
+        Raises:
+            ValueError: If the batch response is malformed as a whole
+            requests.RequestException: If the API request fails
+        """
+        response = self.session.post(
+            self._geocode_batch_url,
+            params={"key": self.api_key},
+            json=self._geocode_batch_body(addresses),
+            timeout=(self.timeout[0], 30),
+        )
+        response.raise_for_status()
+        return self._parse_geocode_batch_result(response.json(), addresses)
+
+    def _geocode_batch_body(self, addresses: list[str]) -> dict[str, Any]:
+        """Build the JSON body for a batch geocoding request."""
+        if len(addresses) > self.batch_limit:
+            raise ValueError(
+                f"Cannot geocode more than {self.batch_limit} addresses per batch"
+            )
+        return {"locations": addresses, "options": {"maxResults": 1}}
+
+    def _parse_geocode_batch_result(
+        self, result: dict[str, Any], addresses: list[str]
+    ) -> list[Union[Tuple[float, float], ValueError]]:
+        """
+        Extract coordinates for every address from a batch geocoding response.
+
+        MapQuest returns one result per requested location, in request order.
+        Addresses without a usable location are reported as ValueError
+        instances rather than failing the whole batch.
+        """
+        results = result.get("results") or []
+        if len(results) != len(addresses):
+            raise ValueError(
+                f"Expected {len(addresses)} batch geocoding results, got {len(results)}"
+            )
+
+        coordinates: list[Union[Tuple[float, float], ValueError]] = []
+        for address, address_result in zip(addresses, results):
             try:
-                response = requests.get(
-                    f"{self.base_url}/geocoding/v1/address",
-                    params={"key": self.api_key, "location": address},
-                    timeout=10,
+                coordinates.append(
+                    self._parse_geocode_result({"results": [address_result]}, address)
                 )
-                response.raise_for_status()
-                result = response.json()
+            except ValueError as e:
+                coordinates.append(e)
+        return coordinates
 
-                # Validate response structure
-                if not result.get("results"):
-                    raise ValueError(f"No results found for address: {address}")
+    def _parse_geocode_result(
+        self, result: dict[str, Any], address: str
+    ) -> Tuple[float, float]:
+        """
+        Extract coordinates from a MapQuest geocoding response.
 
-                if not result["results"][0].get("locations"):
-                    raise ValueError(f"No locations found for address: {address}")
+        Args:
+            result: Decoded JSON body returned by the geocoding endpoint
+            address: Address that was geocoded, used in error messages
 
-                location = result["results"][0]["locations"][0].get("latLng")
-                if not location or "lat" not in location or "lng" not in location:
-                    raise ValueError(f"Invalid location data for address: {address}")
+        Returns:
+            Tuple of (latitude, longitude)
 
-                return (location["lat"], location["lng"])
+        Raises:
+            ValueError: If the response contains no usable location
+        """
+        # Validate response structure
+        if not result.get("results"):
+            raise ValueError(f"No results found for address: {address}")
 
-            except requests.RequestException as e:
-                if attempt == self.retries - 1:  # Last attempt
-                    logger.error(
-                        f"Failed to geocode after {self.retries} attempts: {str(e)}"
-                    )
-                    raise
-                logger.warning(f"Geocoding attempt {attempt + 1} failed: {str(e)}")
+        if not result["results"][0].get("locations"):
+            raise ValueError(f"No locations found for address: {address}")
 
-            except Exception as e:
-                logger.error(f"Unexpected error in geocode: {str(e)}")
-                raise
+        location = result["results"][0]["locations"][0].get("latLng")
+        if not location or "lat" not in location or "lng" not in location:
+            raise ValueError(f"Invalid location data for address: {address}")
+
+        return (location["lat"], location["lng"])
 
     def _handle_api_error(self, response: requests.Response) -> None:
         """
@@ -180,3 +323,332 @@ class MapQuestService:
 
         logger.error(f"MapQuest API error: {error_message}")
         raise requests.RequestException(f"API error: {error_message}")
+
+
+class GeocodeMemo:
+    """
+    Thread-safe, size-bounded LRU of geocoding results.
+
+    Keys are normalized addresses, so trivially different spellings of the
+    same address share one entry.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, address: str) -> Optional[Tuple[float, float]]:
+        """Get the coordinates memoized for an address, if any."""
+        key = normalize_address(address)
+        with self._lock:
+            coordinates = self._entries.get(key)
+            if coordinates is not None:
+                self._entries.move_to_end(key)
+            return coordinates
+
+    def set(self, address: str, coordinates: Tuple[float, float]) -> None:
+        """Memoize an address's coordinates, evicting the least recently used."""
+        key = normalize_address(address)
+        with self._lock:
+            self._entries[key] = coordinates
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every memoized address."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide, shared by every MapQuestService; failures are not memoized
+geocode_memo = GeocodeMemo(maxsize=10_000)
+
+
+MILES_PER_DEGREE = 69.0  # Miles per degree of latitude
+ROUTE_SEGMENT_POINTS = 100  # Route points per bounding box segment
+
+
+def haversine_miles(
+    lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray
+) -> np.ndarray:
+    """
+    Great-circle distance in miles between points given in degrees.
+
+    Arguments follow NumPy broadcasting rules.
+    """
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+
+
+def encode_polyline(points: np.ndarray) -> str:
+    """
+    Encode (latitude, longitude) pairs with Google's polyline algorithm.
+
+    Args:
+        points: Array of shape (n, 2) holding latitude/longitude in degrees
+
+    Returns:
+        Encoded polyline string
+    """
+    encoded = []
+    previous = np.zeros(2, dtype=np.int64)
+    for point in np.round(np.asarray(points) * 1e5).astype(np.int64):
+        for delta in point - previous:
+            value = ~(int(delta) << 1) if delta < 0 else int(delta) << 1
+            while value >= 0x20:
+                encoded.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            encoded.append(chr(value + 63))
+        previous = point
+    return "".join(encoded)
+
+
+class FuelOptimizationService:
+    """
+    Service for choosing the cheapest fuel stops along a route.
+
+    The vehicle starts with a full tank, can travel ``settings.MAX_RANGE``
+    miles on it and uses one gallon every ``settings.MILES_PER_GALLON`` miles.
+    """
+
+    def __init__(self) -> None:
+        self.max_range = settings.MAX_RANGE
+        self.miles_per_gallon = settings.MILES_PER_GALLON
+        self.search_radius = settings.STATION_SEARCH_RADIUS
+
+    def find_optimal_stops(
+        self, route_points: list[Tuple[float, float]], total_distance: float
+    ) -> Tuple[list[FuelStation], Decimal]:
+        """
+        Pick fuel stops so the vehicle never runs dry, preferring cheap fuel.
+
+        From each fill-up the cheapest station still within range is chosen,
+        until the destination itself is within range. The starting tank is
+        charged at the cheapest price within range of the start, so the cost
+        covers fuel for the whole trip.
+
+        Args:
+            route_points: (latitude, longitude) points along the route, in order
+            total_distance: Total route distance in miles
+
+        Returns:
+            Tuple of (fuel stops in route order, total cost of fuel for the
+            trip). The cost is computed in float64 and rounded to cents only
+            when converted to Decimal at the end.
+
+        Raises:
+            ValidationError: If there are no stations near the route, or a
+                stretch of it is longer than the vehicle's range
+        """
+        candidates = sorted(
+            self._get_stations_near_route(route_points), key=lambda c: c[1]
+        )
+        if not candidates:
+            raise ValidationError("No fuel stations found near the route")
+
+        stations = [station for station, _ in candidates]
+        miles = np.fromiter(
+            (mile for _, mile in candidates), dtype=np.float64, count=len(candidates)
+        )
+        prices = np.fromiter(
+            (float(station.retail_price) for station in stations),
+            dtype=np.float64,
+            count=len(stations),
+        )
+
+        stop_indices: list[int] = []
+        position = 0.0
+        while position + self.max_range < total_distance:
+            # Stations strictly ahead of us, and those still within range
+            first = int(np.searchsorted(miles, position, side="right"))
+            last = int(np.searchsorted(miles, position + self.max_range, side="right"))
+            if first == last:
+                raise ValidationError(
+                    f"No fuel station within {self.max_range} miles of mile "
+                    f"{position:.0f}"
+                )
+
+            best = first + int(np.argmin(prices[first:last]))
+            stop_indices.append(best)
+            position = miles[best]
+
+        reachable = miles <= self.max_range
+        if not reachable.any():
+            raise ValidationError(
+                f"No fuel station within {self.max_range} miles of the start"
+            )
+
+        # The starting tank runs to the first stop; at each stop buy just
+        # enough fuel to reach the next stop or the end
+        stops = np.array(stop_indices, dtype=np.intp)
+        stop_miles = miles[stops]
+        leg_miles = np.append(stop_miles, total_distance) - np.append(0.0, stop_miles)
+        leg_prices = np.append(prices[reachable].min(), prices[stops])
+        gallons = np.maximum(leg_miles, 0) / self.miles_per_gallon
+        total_cost = float(gallons @ leg_prices)
+
+        return [stations[i] for i in stop_indices], Decimal(f"{total_cost:.2f}")
+
+    def _get_stations_near_route(
+        self, route_points: list[Tuple[float, float]]
+    ) -> list[Tuple[FuelStation, float]]:
+        """
+        Find stations within ``search_radius`` miles of the route.
+
+        Candidates are pruned in memory against the station index with one
+        bounding box per route segment; the exact great-circle distance is
+        then checked for those candidates only, and just the stations that
+        pass are loaded from the database.
+
+        Args:
+            route_points: (latitude, longitude) points along the route, in order
+
+        Returns:
+            List of (station, mile marker of the closest route point) tuples
+        """
+        points = np.ascontiguousarray(route_points, dtype=np.float64)
+        if not len(points):
+            return []
+
+        pks, lats, lngs = station_index.arrays()
+        candidates = np.flatnonzero(self._corridor_mask(lats, lngs, points))
+        if not len(candidates):
+            return []
+
+        coords = np.ascontiguousarray(
+            np.column_stack((lats[candidates], lngs[candidates]))
+        )
+        nearest, nearest_distance = nearest_route_point(coords, points)
+        near = nearest_distance <= self.search_radius
+
+        # Cumulative miles along the route at every route point
+        route_miles = np.concatenate(
+            (
+                [0.0],
+                np.cumsum(
+                    haversine_miles(
+                        points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1]
+                    )
+                ),
+            )
+        )
+        mile_by_pk = dict(
+            zip(pks[candidates][near].tolist(), route_miles[nearest[near]].tolist())
+        )
+
+        stations = FuelStation.objects.filter(pk__in=list(mile_by_pk)).only(
+            "station_id", "retail_price"
+        )
+        return [(station, mile_by_pk[station.pk]) for station in stations]
+
+    def _corridor_mask(
+        self, lats: np.ndarray, lngs: np.ndarray, points: np.ndarray
+    ) -> np.ndarray:
+        """
+        Flag stations inside the bounding box of any route segment.
+
+        Each box is grown by ``search_radius``, with the longitude margin
+        taken at the route's highest latitude, so the mask is a superset of
+        the exact distance check. Splitting the route into segments keeps
+        the boxes tight on long diagonal routes.
+        """
+        # A degree of longitude shrinks towards the poles; allow a degree of slack
+        max_lat = min(float(np.abs(points[:, 0]).max()) + 1.0, 89.0)
+        margin = np.array(
+            [
+                self.search_radius / MILES_PER_DEGREE,
+                self.search_radius
+                / (MILES_PER_DEGREE * math.cos(math.radians(max_lat))),
+            ]
+        )
+
+        # Segments share their end points so the route stays continuous
+        segments = [
+            points[first : first + ROUTE_SEGMENT_POINTS + 1]
+            for first in range(0, max(len(points) - 1, 1), ROUTE_SEGMENT_POINTS)
+        ]
+        lower = np.array([segment.min(axis=0) for segment in segments]) - margin
+        upper = np.array([segment.max(axis=0) for segment in segments]) + margin
+
+        # Stations (rows) against segment boxes (columns)
+        inside = (
+            (lats[:, None] >= lower[:, 0])
+            & (lats[:, None] <= upper[:, 0])
+            & (lngs[:, None] >= lower[:, 1])
+            & (lngs[:, None] <= upper[:, 1])
+        )
+        return inside.any(axis=1)
+
+
+class RoutePlannerService:
+    """
+    Service that plans a route and its fuel stops, and stores the result.
+
+    Instances are safe to share between threads: they hold only
+    configuration and the module-level requests session, which is
+    thread-safe for independent requests.
+    """
+
+    def __init__(self) -> None:
+        self.map_quest = MapQuestService()
+        self.fuel_optimizer = FuelOptimizationService()
+
+    def plan_route(self, start: str, end: str) -> Route:
+        """
+        Plan a route between two locations with optimal fuel stops.
+
+        Start and end coordinates are taken from the ends of the route shape,
+        so planning costs a single MapQuest request.
+
+        Args:
+            start: Starting location address
+            end: Destination address
+
+        Returns:
+            The saved Route
+
+        Raises:
+            ValidationError: If MapQuest returns no usable route
+            requests.RequestException: If the MapQuest API request fails
+        """
+        try:
+            result = self.map_quest.get_route(start, end)["route"]
+            # MapQuest returns a flat [lat, lng, lat, lng, ...] list
+            route_points = np.asarray(
+                result["shape"]["shapePoints"], dtype=np.float64
+            ).reshape(-1, 2)
+            if not len(route_points):
+                raise ValueError("Route has no shape points")
+            total_distance = float(result["distance"])
+            stops, total_fuel_cost = self.fuel_optimizer.find_optimal_stops(
+                route_points, total_distance
+            )
+        except (KeyError, ValueError) as e:
+            message = f"Could not plan route from {start} to {end}: {str(e)}"
+            logger.warning(message)
+            raise ValidationError(message)
+
+        (start_lat, start_lng), (end_lat, end_lng) = route_points[0], route_points[-1]
+        with transaction.atomic():
+            route = Route.objects.create(
+                start_location=start,
+                end_location=end,
+                start_coords=Point(start_lng, start_lat),
+                end_coords=Point(end_lng, end_lat),
+                total_distance=Decimal(f"{total_distance:.2f}"),
+                total_fuel_cost=total_fuel_cost,
+                fuel_stops=[station.station_id for station in stops],
+                route_polyline=encode_polyline(route_points),
+            )
+            RouteStop.objects.bulk_create(
+                RouteStop(route=route, station=station, order=order)
+                for order, station in enumerate(stops)
+            )
+
+        return route
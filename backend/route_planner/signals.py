@@ -0,0 +1,56 @@
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_route_pages
+from .models import FuelStation, Route
+from .services import route_cache_key
+from .station_index import invalidate_station_index
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Route)
+@receiver(post_delete, sender=Route)
+def route_changed(sender: type, **kwargs) -> None:
+    """
+    Invalidate cached route pages when a route changes.
+
+    Runs after the transaction commits, so a request served in between
+    cannot cache a page that is missing the change.
+    """
+    transaction.on_commit(invalidate_route_pages)
+
+
+@receiver(post_delete, sender=Route)
+def forget_planned_route(sender: type, instance: Route, **kwargs) -> None:
+    """
+    Drop the cached plan for a deleted route's trip.
+
+    The cached create response carries the route id, so keeping it would
+    hand out the id of a route that no longer exists.
+    """
+    key = route_cache_key(instance.start_location, instance.end_location)
+
+    def delete_key() -> None:
+        try:
+            cache.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed: {str(e)}")
+
+    transaction.on_commit(delete_key)
+
+
+@receiver(post_save, sender=FuelStation)
+@receiver(post_delete, sender=FuelStation)
+def invalidate_stations(sender: type, **kwargs) -> None:
+    """
+    Reload the station index and drop cached route pages after a change commits.
+
+    Route details embed each station's live data, so their pages go too.
+    """
+    transaction.on_commit(invalidate_station_index)
+    transaction.on_commit(invalidate_route_pages)
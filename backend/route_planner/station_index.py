@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import FloatField, Func
+
+from .models import FuelStation
+
+logger = logging.getLogger(__name__)
+
+
+class StationIndex:
+    """
+    In-process snapshot of every station's location as parallel arrays.
+
+    Primary keys, latitudes and longitudes are held in contiguous NumPy
+    arrays so the stations near a route can be found without a database
+    query. Processes share a version stamp in the cache; the snapshot is
+    reloaded lazily whenever the stamp differs from the one it was loaded
+    at, which ``invalidate_station_index`` forces after stations change.
+    While the stamp cannot be read, the snapshot is instead reloaded once it
+    is older than ``FALLBACK_MAX_AGE`` seconds.
+    """
+
+    VERSION_KEY = "stations:version"
+    FALLBACK_MAX_AGE = 300  # 5 minutes
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._loaded_at = 0.0
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the current snapshot, reloading it if stations have changed.
+
+        Returns:
+            Tuple of (primary keys, latitudes, longitudes), one entry per station
+        """
+        version = self._current_version()
+        with self._lock:
+            if self._is_stale(version):
+                self._arrays = self._load()
+                self._version = version
+                self._loaded_at = time.monotonic()
+            return self._arrays
+
+    def warm(self) -> None:
+        """
+        Load the snapshot ahead of the first request that needs it.
+
+        Failures are logged and left for the first request to retry, so a
+        server can start before the stations table exists. The connection
+        used for the load is closed so it is never shared with forked workers.
+        """
+        try:
+            self.arrays()
+        except Exception as e:
+            logger.warning(f"Station index warm-up failed: {str(e)}")
+        finally:
+            connections.close_all()
+
+    def _is_stale(self, version: Optional[str]) -> bool:
+        """Check whether the snapshot must be reloaded for ``version``."""
+        if self._arrays is None:
+            return True
+        if version is None:
+            return time.monotonic() - self._loaded_at > self.FALLBACK_MAX_AGE
+        return version != self._version
+
+    def _current_version(self) -> Optional[str]:
+        """Read the shared version stamp, creating one if it has been evicted."""
+        try:
+            version = cache.get(self.VERSION_KEY)
+            if version is None:
+                cache.add(self.VERSION_KEY, uuid4().hex, None)
+                version = cache.get(self.VERSION_KEY)
+            return version
+        except Exception as e:
+            logger.warning(f"Station index version check failed: {str(e)}")
+            return None
+
+    def _load(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read every station's primary key and coordinates from the database."""
+        rows = list(
+            FuelStation.objects.annotate(
+                lat=Func("location", function="ST_Y", output_field=FloatField()),
+                lng=Func("location", function="ST_X", output_field=FloatField()),
+            ).values_list("pk", "lat", "lng")
+        )
+        logger.info(f"Loaded {len(rows)} stations into the station index")
+        return (
+            np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)),
+            np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows)),
+            np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows)),
+        )
+
+
+def invalidate_station_index() -> None:
+    """Make every process reload its station index on next use."""
+    try:
+        cache.set(StationIndex.VERSION_KEY, uuid4().hex, None)
+    except Exception as e:
+        logger.warning(f"Station index invalidation failed: {str(e)}")
+
+
+station_index = StationIndex()
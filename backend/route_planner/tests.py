@@ -1,24 +1,44 @@
 import json
 
 from decimal import Decimal
-from typing import Any
-from unittest.mock import Mock, patch
+from typing import Any, Callable, Iterator, Tuple
+from unittest.mock import AsyncMock, Mock, patch
 
+import aiohttp
+import numpy as np
 import pytest
+import requests
 from django.contrib.gis.geos import Point
 from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.core.management import call_command
 from rest_framework.test import APIClient
 
-from .models import FuelStation, Route
+from ._kernels import nearest_route_point
+from .management.commands.import_stations import retry_on_failure
+from .models import FuelStation, Route, RouteStop
+from .renderers import ORJSONRenderer
+from .serializers import RouteResponseSerializer, route_response_data
+from .station_index import StationIndex, invalidate_station_index, station_index
 from .services import (
     FuelOptimizationService,
     MapQuestService,
     RoutePlannerService,
+    cache_safe,
+    encode_polyline,
+    geocode_memo,
+    route_cache_key,
 )
 
 
 # Fixtures
+@pytest.fixture
+def clear_cache() -> None:
+    """Start a test with empty caches, including cached pages."""
+    cache.clear()
+    geocode_memo.clear()
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """Create a test API client."""
@@ -63,10 +83,29 @@ def sample_stations() -> list[FuelStation]:
     return stations
 
 
+@pytest.fixture
+def make_austin_station() -> Callable[[], FuelStation]:
+    """Create, on demand, a station that is not in ``sample_stations``."""
+
+    def create() -> FuelStation:
+        return FuelStation.objects.create(
+            station_id=4,
+            name="Station 4",
+            address="1 Elm St",
+            city="City4",
+            state="TX",
+            rack_id=4,
+            retail_price=Decimal("3.10"),
+            location=Point(-97.7431, 30.2672),  # Austin
+        )
+
+    return create
+
+
 @pytest.fixture
 def sample_route(sample_stations: list[FuelStation]) -> Route:
     """Create a sample route for testing."""
-    return Route.objects.create(
+    route = Route.objects.create(
         start_location="Los Angeles, CA",
         end_location="New York, NY",
         start_coords=Point(-118.2437, 34.0522),
@@ -76,26 +115,48 @@ def sample_route(sample_stations: list[FuelStation]) -> Route:
         fuel_stops=[station.station_id for station in sample_stations],
         route_polyline="sample_polyline_data",
     )
+    RouteStop.objects.bulk_create(
+        RouteStop(route=route, station=station, order=order)
+        for order, station in enumerate(sample_stations)
+    )
+    return route
 
 
 @pytest.fixture
 def mock_mapquest_response() -> dict[str, Any]:
-    """Create mock MapQuest API response."""
+    """Create mock MapQuest API response for a route the sample stations cover."""
     return {
         "route": {
-            "distance": 2789.5,
+            "distance": 790.0,
             "shape": {
                 "shapePoints": [
                     [34.0522, -118.2437],
                     [33.4484, -112.0740],
                     [35.0844, -106.6504],
-                    [40.7128, -74.0060],
                 ]
             },
         }
     }
 
 
+@pytest.fixture
+def mock_batch_geocode() -> Iterator[Callable[[Tuple[float, float]], AsyncMock]]:
+    """Patch the import's batch geocoding to place every address at one point."""
+    with patch(
+        "route_planner.management.commands.import_stations."
+        "EnhancedMapQuestService.geocode_batch_async",
+        new_callable=AsyncMock,
+    ) as mock_geocode:
+
+        def place_at(coordinates: Tuple[float, float]) -> AsyncMock:
+            mock_geocode.side_effect = lambda session, addresses, semaphore=None: [
+                coordinates
+            ] * len(addresses)
+            return mock_geocode
+
+        yield place_at
+
+
 # Model Tests
 @pytest.mark.django_db
 class TestFuelStation:
@@ -127,10 +188,11 @@ class TestFuelStation:
 
 # Service Tests
 @pytest.mark.django_db
+@pytest.mark.usefixtures("clear_cache")
 class TestMapQuestService:
     """Test cases for the MapQuest service."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_route(
         self, mock_get: Mock, mock_mapquest_response: dict[str, Any]
     ) -> None:
@@ -144,7 +206,7 @@ class TestMapQuestService:
         assert result == mock_mapquest_response
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_geocode(self, mock_get: Mock) -> None:
         """Test address geocoding."""
         mock_response = {
@@ -159,9 +221,53 @@ class TestMapQuestService:
         assert lat == 34.0522
         assert lng == -118.2437
         mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["params"]["location"] == "Los Angeles, CA"
+
+        # The same address, spelled differently, is served from memory
+        assert service.geocode("  los angeles,   CA") == (lat, lng)
+        mock_get.assert_called_once()
+
+    def test_session_is_shared(self) -> None:
+        """Test that services reuse one pooled, retrying session."""
+        session = MapQuestService().session
+
+        assert MapQuestService().session is session
+        retry = session.get_adapter("https://www.mapquestapi.com").max_retries
+        assert retry.total == 3
+        assert 503 in retry.status_forcelist
+
+    @patch("requests.Session.post")
+    def test_geocode_batch(self, mock_post: Mock) -> None:
+        """Test geocoding several addresses with one batch request."""
+        mock_post.return_value.json.return_value = {
+            "results": [
+                {"locations": [{"latLng": {"lat": 34.0522, "lng": -118.2437}}]},
+                {"locations": []},
+            ]
+        }
+        mock_post.return_value.raise_for_status.return_value = None
+
+        service = MapQuestService()
+        results = service.geocode_batch(["Los Angeles, CA", "Nowhere, ZZ"])
+
+        assert results[0] == (34.0522, -118.2437)
+        assert isinstance(results[1], ValueError)
+        mock_post.assert_called_once()
+
+
+class TestCacheSafe:
+    """Test cases for the best-effort caching decorator."""
+
+    def test_unpicklable_argument_skips_cache(self) -> None:
+        """Test that arguments that cannot be hashed into a key skip the cache."""
+        func = Mock(__name__="plan", return_value="planned")
+
+        assert cache_safe(func)(None, lambda: None) == "planned"
+        func.assert_called_once()
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures("clear_cache")
 class TestFuelOptimizationService:
     """Test cases for the fuel optimization service."""
 
@@ -180,6 +286,38 @@ class TestFuelOptimizationService:
         assert isinstance(cost, Decimal)
         assert cost > 0
 
+    def test_short_trip_charges_starting_tank(
+        self, sample_stations: list[FuelStation]
+    ) -> None:
+        """Test a trip within range is charged at the cheapest nearby price."""
+        service = FuelOptimizationService()
+        route_points = [(34.0522, -118.2437), (33.4484, -112.0740)]
+
+        stops, cost = service.find_optimal_stops(route_points, 360.0)
+
+        assert stops == []
+        assert cost == Decimal("117.00")  # 36 gallons at Phoenix's 3.25
+
+    def test_no_stations_near_route(self) -> None:
+        """Test a route without stations nearby cannot be planned."""
+        service = FuelOptimizationService()
+        route_points = [(34.0522, -118.2437), (33.4484, -112.0740)]
+
+        with pytest.raises(ValidationError):
+            service.find_optimal_stops(route_points, 360.0)
+
+    def test_station_out_of_range(self, sample_stations: list[FuelStation]) -> None:
+        """Test a stretch longer than the vehicle's range cannot be planned."""
+        service = FuelOptimizationService()
+        route_points = [
+            (34.0522, -118.2437),
+            (33.4484, -112.0740),
+            (35.0844, -106.6504),
+        ]
+
+        with pytest.raises(ValidationError):
+            service.find_optimal_stops(route_points, 1500.0)
+
     def test_get_stations_near_route(self, sample_stations: list[FuelStation]) -> None:
         """Test finding stations near route."""
         service = FuelOptimizationService()
@@ -188,9 +326,107 @@ class TestFuelOptimizationService:
         stations = service._get_stations_near_route(route_points)
         assert len(stations) > 0
 
+    def test_station_index_reloads_after_invalidation(
+        self,
+        sample_stations: list[FuelStation],
+        make_austin_station: Callable[[], FuelStation],
+    ) -> None:
+        """Test the station index picks up stations added after it loaded."""
+        assert len(station_index.arrays()[0]) == 3
+
+        make_austin_station()
+        invalidate_station_index()
+
+        pks, lats, lngs = station_index.arrays()
+        assert len(pks) == 4
+        assert 30.2672 in lats.tolist()
+
+    def test_station_index_reloads_by_age_without_cache(
+        self,
+        sample_stations: list[FuelStation],
+        make_austin_station: Callable[[], FuelStation],
+    ) -> None:
+        """Test the station index falls back to a maximum age without a cache."""
+        index = StationIndex()
+        with patch.object(index, "_current_version", return_value=None):
+            assert len(index.arrays()[0]) == 3
+
+            make_austin_station()
+            assert len(index.arrays()[0]) == 3
+
+            index._loaded_at -= StationIndex.FALLBACK_MAX_AGE + 1
+            assert len(index.arrays()[0]) == 4
+
+
+# Polyline Tests
+class TestEncodePolyline:
+    """Test cases for the route polyline encoder."""
+
+    def test_encode_polyline(self) -> None:
+        """Test encoding against Google's reference example."""
+        points = np.array([(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)])
+
+        assert encode_polyline(points) == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+
+    def test_encode_empty_polyline(self) -> None:
+        """Test encoding a route without points."""
+        assert encode_polyline(np.empty((0, 2))) == ""
+
+
+# Kernel Tests
+class TestNearestRoutePoint:
+    """Test cases for the compiled distance kernel."""
+
+    def test_nearest_route_point(self) -> None:
+        """Test the compiled nearest-route-point kernel."""
+        stations = np.array([(34.0522, -118.2437), (35.0844, -106.6504)])
+        route_points = np.array([(34.0522, -118.2437), (33.4484, -112.0740)])
+
+        nearest, distance = nearest_route_point(stations, route_points)
+
+        assert nearest.tolist() == [0, 1]
+        assert distance[0] == pytest.approx(0.0, abs=1e-6)
+        assert distance[1] == pytest.approx(329.6, abs=0.1)
+
+
+# Renderer Tests
+class TestORJSONRenderer:
+    """Test cases for the orjson-backed JSON renderer."""
+
+    def test_render(self) -> None:
+        """Test rendering nested data containing Decimals."""
+        data = {
+            "total_fuel_cost": Decimal("875.25"),
+            "fuel_stops": [{"station_id": 1, "latitude": 34.0522}],
+        }
+
+        rendered = ORJSONRenderer().render(data)
+
+        assert json.loads(rendered) == {
+            "total_fuel_cost": "875.25",
+            "fuel_stops": [{"station_id": 1, "latitude": 34.0522}],
+        }
+
+    def test_render_none(self) -> None:
+        """Test rendering an empty body."""
+        assert ORJSONRenderer().render(None) == b""
+
+
+# Serializer Tests
+@pytest.mark.django_db
+class TestRouteResponseData:
+    """Test cases for the hand-built route response."""
+
+    def test_matches_serializer(self, sample_route: Route) -> None:
+        """Test the fast path renders exactly like RouteResponseSerializer."""
+        assert route_response_data(sample_route) == (
+            RouteResponseSerializer(sample_route).data
+        )
+
 
 # View Tests
 @pytest.mark.django_db
+@pytest.mark.usefixtures("clear_cache")
 class TestRoutePlannerViewSet:
     """Test cases for the RoutePlannerViewSet."""
 
@@ -206,10 +442,13 @@ class TestRoutePlannerViewSet:
         ) as mock_get_route:
             mock_get_route.return_value = mock_mapquest_response
 
-            data = {"start_location": "Los Angeles, CA", "end_location": "New York, NY"}
+            data = {
+                "start_location": "Los Angeles, CA",
+                "end_location": "Albuquerque, NM",
+            }
 
             response = api_client.post(
-                "/api/route/", data=json.dumps(data), content_type="application/json"
+                "/api/routes/", data=json.dumps(data), content_type="application/json"
             )
 
             assert response.status_code == 200
@@ -217,6 +456,42 @@ class TestRoutePlannerViewSet:
             assert "fuel_stops" in response.data
             assert "total_fuel_cost" in response.data
 
+    def test_create_route_mapquest_unavailable(
+        self, api_client: APIClient, sample_stations: list[FuelStation]
+    ) -> None:
+        """Test that a MapQuest outage is reported as a bad gateway."""
+        with patch(
+            "route_planner.services.MapQuestService.get_route",
+            side_effect=requests.ConnectionError("connection refused"),
+        ):
+            data = {"start_location": "Los Angeles, CA", "end_location": "New York, NY"}
+
+            response = api_client.post(
+                "/api/routes/", data=json.dumps(data), content_type="application/json"
+            )
+
+        assert response.status_code == 502
+
+    def test_create_route_without_stations(
+        self, api_client: APIClient, mock_mapquest_response: dict[str, Any]
+    ) -> None:
+        """Test that a route the vehicle cannot refuel on is rejected."""
+        with patch(
+            "route_planner.services.MapQuestService.get_route",
+            return_value=mock_mapquest_response,
+        ):
+            data = {
+                "start_location": "Los Angeles, CA",
+                "end_location": "Albuquerque, NM",
+            }
+
+            response = api_client.post(
+                "/api/routes/", data=json.dumps(data), content_type="application/json"
+            )
+
+        assert response.status_code == 400
+        assert not Route.objects.exists()
+
     def test_invalid_request(self, api_client: APIClient) -> None:
         """Test route creation with invalid data."""
         data = {
@@ -225,18 +500,131 @@ class TestRoutePlannerViewSet:
         }
 
         response = api_client.post(
-            "/api/route/", data=json.dumps(data), content_type="application/json"
+            "/api/routes/", data=json.dumps(data), content_type="application/json"
         )
 
         assert response.status_code == 400
 
+    def test_list_routes_fetches_stations_once(
+        self,
+        api_client: APIClient,
+        sample_route: Route,
+        django_assert_num_queries: Any,
+    ) -> None:
+        """Test listing routes does not query stations once per route."""
+        route = Route.objects.create(
+            start_location="Phoenix, AZ",
+            end_location="Los Angeles, CA",
+            start_coords=Point(-112.0740, 33.4484),
+            end_coords=Point(-118.2437, 34.0522),
+            total_distance=Decimal("372.0"),
+            total_fuel_cost=Decimal("120.90"),
+            fuel_stops=[2, 1],
+            route_polyline="sample_polyline_data",
+        )
+        RouteStop.objects.bulk_create(
+            RouteStop(
+                route=route,
+                station=FuelStation.objects.get(station_id=station_id),
+                order=order,
+            )
+            for order, station_id in enumerate([2, 1])
+        )
+
+        # Routes, their stops, and the stations behind them
+        with django_assert_num_queries(3):
+            response = api_client.get("/api/routes/?include=polyline")
+
+        assert response.status_code == 200
+        assert [
+            stop["station_id"] for stop in response.data["results"][0]["fuel_stops"]
+        ] == [2, 1]
+
+    def test_list_routes_paginated_summary(
+        self, api_client: APIClient, sample_route: Route
+    ) -> None:
+        """Test the default route list is a paginated summary."""
+        response = api_client.get("/api/routes/")
+
+        assert response.status_code == 200
+        assert response.data["next"] is None
+        assert [route["id"] for route in response.data["results"]] == [sample_route.id]
+        assert "route_polyline" not in response.data["results"][0]
+        assert "fuel_stops" not in response.data["results"][0]
+
+    def test_retrieve_route_not_modified(
+        self, api_client: APIClient, sample_route: Route
+    ) -> None:
+        """Test that a client holding the current ETag gets a bodiless 304."""
+        response = api_client.get(f"/api/routes/{sample_route.id}/")
+        assert response.status_code == 200
+
+        response = api_client.get(
+            f"/api/routes/{sample_route.id}/",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_retrieve_route_modified_by_station_change(
+        self,
+        api_client: APIClient,
+        sample_route: Route,
+        sample_stations: list[FuelStation],
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        """Test that a price change on a stop invalidates the route's ETag."""
+        response = api_client.get(f"/api/routes/{sample_route.id}/")
+        etag = response["ETag"]
+
+        station = sample_stations[0]
+        station.retail_price = Decimal("2.99")
+        with django_capture_on_commit_callbacks(execute=True):
+            station.save()
+
+        response = api_client.get(
+            f"/api/routes/{sample_route.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.data["fuel_stops"][0]["retail_price"] == "2.990"
+
+    def test_list_routes_page_cached_until_route_changes(
+        self,
+        api_client: APIClient,
+        sample_route: Route,
+        django_assert_num_queries: Any,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        """Test list pages are cached and dropped when a route changes."""
+        first = api_client.get("/api/routes/")
+
+        with django_assert_num_queries(0):
+            second = api_client.get("/api/routes/")
+        assert second.content == first.content
+
+        invalidate_station_index()
+        station_version = cache.get(StationIndex.VERSION_KEY)
+        with django_capture_on_commit_callbacks(execute=True):
+            sample_route.delete()
+
+        response = api_client.get("/api/routes/")
+        assert response.data["results"] == []
+        # Only route pages are dropped; other cache entries survive
+        assert cache.get(StationIndex.VERSION_KEY) == station_version
+
 
 # Management Command Tests
 @pytest.mark.django_db
+@pytest.mark.usefixtures("clear_cache")
 class TestLoadFuelDataCommand:
     """Test cases for the loadfueldata management command."""
 
-    def test_load_fuel_data(self, tmp_path: str) -> None:
+    def test_load_fuel_data(
+        self, tmp_path: str, mock_batch_geocode: Callable[..., AsyncMock]
+    ) -> None:
         """Test loading fuel data from CSV."""
         # Create test CSV file
         csv_content = """OPIS Truckstop ID,Truckstop Name,Address,City,State,Rack ID,Retail Price
@@ -244,16 +632,122 @@ class TestLoadFuelDataCommand:
         csv_file = tmp_path / "test_fuel_data.csv"
         csv_file.write_text(csv_content)
 
-        with patch("route_planner.services.MapQuestService.geocode") as mock_geocode:
-            mock_geocode.return_value = (34.0522, -118.2437)
+        mock_batch_geocode((34.0522, -118.2437))
+
+        call_command("loadfueldata", f"--csv-file={csv_file}")
+
+        assert FuelStation.objects.count() == 1
+        station = FuelStation.objects.first()
+        assert station.station_id == 1
+        assert station.name == "Test Station"
+        assert station.retail_price == Decimal("3.50")
+
+    def test_load_fuel_data_skips_duplicate_ids(
+        self, tmp_path: str, mock_batch_geocode: Callable[..., AsyncMock]
+    ) -> None:
+        """Test that a station repeated in the CSV is inserted once."""
+        csv_content = """OPIS Truckstop ID,Truckstop Name,Address,City,State,Rack ID,Retail Price
+20,PILOT TRAVEL CENTER #1243,"I-8, EXIT 119 & SR-85",Gila Bend,AZ,930,3.899
+20,PILOT #1243,"I-8, EXIT 119 & SR-85",Gila Bend,AZ,930,3.899"""
+        csv_file = tmp_path / "test_fuel_data.csv"
+        csv_file.write_text(csv_content)
+
+        mock_geocode = mock_batch_geocode((32.9481, -112.7168))
+
+        call_command("loadfueldata", f"--csv-file={csv_file}")
+
+        assert FuelStation.objects.count() == 1
+        assert FuelStation.objects.get(station_id=20).name == (
+            "PILOT TRAVEL CENTER #1243"
+        )
+        mock_geocode.assert_called_once()
+
+    def test_load_fuel_data_bulk(
+        self,
+        tmp_path: str,
+        django_assert_max_num_queries: Any,
+        mock_batch_geocode: Callable[..., AsyncMock],
+    ) -> None:
+        """Test that a large CSV is geocoded in batches and inserted in bulk."""
+        rows = [
+            f"{i},Station {i},{i} Main St,City{i % 50},TX,{i % 100},3.{i % 1000:03d}"
+            for i in range(1, 10_001)
+        ]
+        csv_file = tmp_path / "test_fuel_data.csv"
+        csv_file.write_text(
+            "OPIS Truckstop ID,Truckstop Name,Address,City,State,Rack ID,Retail Price\n"
+            + "\n".join(rows)
+        )
+
+        mock_geocode = mock_batch_geocode((31.9686, -99.9018))
 
+        # A fixed handful of statements, however many rows are loaded
+        with django_assert_max_num_queries(10):
             call_command("loadfueldata", f"--csv-file={csv_file}")
 
-            assert FuelStation.objects.count() == 1
-            station = FuelStation.objects.first()
-            assert station.station_id == 1
-            assert station.name == "Test Station"
-            assert station.retail_price == Decimal("3.50")
+        # 10,000 distinct addresses at 100 per batch request
+        assert mock_geocode.call_count == 100
+        assert FuelStation.objects.count() == 10_000
+        station = FuelStation.objects.get(station_id=10_000)
+        assert station.name == "Station 10000"
+        assert station.city == "City0"
+        assert station.rack_id == 0
+        assert station.retail_price == Decimal("3.000")
+        assert (station.location.x, station.location.y) == (-99.9018, 31.9686)
+
+    def test_load_fuel_data_numeric_text_columns(
+        self, tmp_path: str, mock_batch_geocode: Callable[..., AsyncMock]
+    ) -> None:
+        """Test that text columns holding only digits are read as text."""
+        csv_content = """OPIS Truckstop ID,Truckstop Name,Address,City,State,Rack ID,Retail Price
+1,76,100,12,CA,1,3.50"""
+        csv_file = tmp_path / "test_fuel_data.csv"
+        csv_file.write_text(csv_content)
+
+        mock_geocode = mock_batch_geocode((34.0522, -118.2437))
+
+        call_command("loadfueldata", f"--csv-file={csv_file}")
+
+        assert mock_geocode.call_args.args[1] == ["100, 12, CA"]
+        station = FuelStation.objects.get(station_id=1)
+        assert (station.name, station.address, station.city) == ("76", "100", "12")
+
+    def test_force_reload_empty_file(
+        self, sample_stations: list[FuelStation], tmp_path: str
+    ) -> None:
+        """Test that force reloading a header-only CSV leaves stations untouched."""
+        csv_file = tmp_path / "test_fuel_data.csv"
+        csv_file.write_text(
+            "OPIS Truckstop ID,Truckstop Name,Address,City,State,Rack ID,Retail Price\n"
+        )
+
+        call_command("loadfueldata", f"--csv-file={csv_file}", "--force")
+
+        assert FuelStation.objects.count() == len(sample_stations)
+
+    def test_load_fuel_data_stops_on_rejected_api_key(self, tmp_path: str) -> None:
+        """Test that an auth failure stops the import instead of falling back."""
+        csv_file = tmp_path / "test_fuel_data.csv"
+        csv_file.write_text(
+            "OPIS Truckstop ID,Truckstop Name,Address,City,State,Rack ID,Retail Price\n"
+            "1,Test Station,123 Test St,Test City,CA,1,3.50"
+        )
+
+        with patch(
+            "route_planner.management.commands.import_stations."
+            "EnhancedMapQuestService.geocode_batch_async",
+            new_callable=AsyncMock,
+            side_effect=aiohttp.ClientResponseError(Mock(), (), status=401),
+        ), patch(
+            "route_planner.management.commands.import_stations."
+            "EnhancedMapQuestService.geocode_async",
+            new_callable=AsyncMock,
+        ) as mock_geocode:
+            with pytest.raises(aiohttp.ClientResponseError):
+                call_command("loadfueldata", f"--csv-file={csv_file}")
+
+        mock_geocode.assert_not_called()
+        assert not FuelStation.objects.exists()
 
     def test_skip_existing_data(
         self, sample_stations: list[FuelStation], tmp_path: str
@@ -269,7 +763,10 @@ class TestLoadFuelDataCommand:
         assert FuelStation.objects.count() == initial_count
 
     def test_force_reload_data(
-        self, sample_stations: list[FuelStation], tmp_path: str
+        self,
+        sample_stations: list[FuelStation],
+        tmp_path: str,
+        mock_batch_geocode: Callable[..., AsyncMock],
     ) -> None:
         """Test force reloading data."""
         csv_content = """OPIS Truckstop ID,Truckstop Name,Address,City,State,Rack ID,Retail Price
@@ -277,18 +774,62 @@ class TestLoadFuelDataCommand:
         csv_file = tmp_path / "test_fuel_data.csv"
         csv_file.write_text(csv_content)
 
-        with patch("route_planner.services.MapQuestService.geocode") as mock_geocode:
-            mock_geocode.return_value = (34.0522, -118.2437)
+        mock_batch_geocode((34.0522, -118.2437))
 
-            call_command("loadfueldata", f"--csv-file={csv_file}", "--force")
+        call_command("loadfueldata", f"--csv-file={csv_file}", "--force")
 
-            station = FuelStation.objects.get(station_id=1)
-            assert station.name == "New Station"
-            assert station.retail_price == Decimal("3.75")
+        station = FuelStation.objects.get(station_id=1)
+        assert station.name == "New Station"
+        assert station.retail_price == Decimal("3.75")
+
+
+class TestRetryOnFailure:
+    """Test cases for the import's retry decorator."""
+
+    @patch("route_planner.management.commands.import_stations.time.sleep")
+    def test_retries_transient_errors(self, mock_sleep: Mock) -> None:
+        """Test that network errors are retried until the call succeeds."""
+        geocode = Mock(side_effect=[requests.ConnectionError("reset"), (1.0, 2.0)])
+
+        assert retry_on_failure(retries=3)(geocode)("1 Main St") == (1.0, 2.0)
+        assert geocode.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("route_planner.management.commands.import_stations.time.sleep")
+    def test_retries_rate_limiting(self, mock_sleep: Mock) -> None:
+        """Test that a 429 response is retried."""
+        rate_limited = aiohttp.ClientResponseError(Mock(), (), status=429)
+        geocode = Mock(side_effect=[rate_limited, (1.0, 2.0)])
+
+        assert retry_on_failure(retries=3)(geocode)("1 Main St") == (1.0, 2.0)
+        assert geocode.call_count == 2
+
+    @patch("route_planner.management.commands.import_stations.time.sleep")
+    def test_does_not_retry_client_errors(self, mock_sleep: Mock) -> None:
+        """Test that a 401 response fails without backing off."""
+        response = requests.Response()
+        response.status_code = 401
+        geocode = Mock(side_effect=requests.HTTPError(response=response))
+
+        with pytest.raises(requests.HTTPError):
+            retry_on_failure(retries=3)(geocode)("1 Main St")
+        geocode.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("route_planner.management.commands.import_stations.time.sleep")
+    def test_does_not_retry_unresolvable_address(self, mock_sleep: Mock) -> None:
+        """Test that a geocoding ValueError fails without backing off."""
+        geocode = Mock(side_effect=ValueError("No results for 1 Main St"))
+
+        with pytest.raises(ValueError):
+            retry_on_failure(retries=3)(geocode)("1 Main St")
+        geocode.assert_called_once()
+        mock_sleep.assert_not_called()
 
 
 # Integration Tests
 @pytest.mark.django_db
+@pytest.mark.usefixtures("clear_cache")
 class TestRouteIntegration:
     """Integration tests for the complete route planning flow."""
 
@@ -308,14 +849,17 @@ class TestRouteIntegration:
             mock_get_route.return_value = mock_mapquest_response
             mock_geocode.return_value = (34.0522, -118.2437)
 
-            data = {"start_location": "Los Angeles, CA", "end_location": "New York, NY"}
+            data = {
+                "start_location": "Los Angeles, CA",
+                "end_location": "Albuquerque, NM",
+            }
 
             # Clear cache
             cache.clear()
 
             # Make request
             response = api_client.post(
-                "/api/route/", data=json.dumps(data), content_type="application/json"
+                "/api/routes/", data=json.dumps(data), content_type="application/json"
             )
 
             assert response.status_code == 200
@@ -325,9 +869,83 @@ class TestRouteIntegration:
             route = Route.objects.get(id=route_id)
 
             assert route.start_location == "Los Angeles, CA"
-            assert route.end_location == "New York, NY"
+            assert route.end_location == "Albuquerque, NM"
             assert len(route.fuel_stops) > 0
+            assert [
+                stop.station.station_id for stop in route.stops.all()
+            ] == route.fuel_stops
 
             # Verify cache was populated
-            cache_key = f"route_{data['start_location']}_{data['end_location']}"
-            assert cache.get(cache_key) is not None
+            cache_key = route_cache_key(data["start_location"], data["end_location"])
+            assert cache.get(cache_key) == response.data
+
+    def test_repeated_route_served_from_cache(
+        self,
+        api_client: APIClient,
+        sample_stations: list[FuelStation],
+        mock_mapquest_response: dict[str, Any],
+    ) -> None:
+        """Test that equivalent requests are answered from the cache."""
+        with patch(
+            "route_planner.services.MapQuestService.get_route"
+        ) as mock_get_route:
+            mock_get_route.return_value = mock_mapquest_response
+            cache.clear()
+
+            first = api_client.post(
+                "/api/routes/",
+                data=json.dumps(
+                    {
+                        "start_location": "Los Angeles, CA",
+                        "end_location": "Albuquerque, NM",
+                    }
+                ),
+                content_type="application/json",
+            )
+            second = api_client.post(
+                "/api/routes/",
+                data=json.dumps(
+                    {
+                        "start_location": "los angeles,  CA ",
+                        "end_location": "ALBUQUERQUE, NM",
+                    }
+                ),
+                content_type="application/json",
+            )
+
+            assert second.status_code == 200
+            assert second.data == first.data
+            assert mock_get_route.call_count == 1
+            assert Route.objects.count() == 1
+
+    def test_deleted_route_not_served_from_cache(
+        self,
+        api_client: APIClient,
+        sample_stations: list[FuelStation],
+        mock_mapquest_response: dict[str, Any],
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        """Test that deleting a route drops its cached plan."""
+        data = json.dumps(
+            {"start_location": "Los Angeles, CA", "end_location": "Albuquerque, NM"}
+        )
+        with patch(
+            "route_planner.services.MapQuestService.get_route"
+        ) as mock_get_route:
+            mock_get_route.return_value = mock_mapquest_response
+
+            first = api_client.post(
+                "/api/routes/", data=data, content_type="application/json"
+            )
+            with django_capture_on_commit_callbacks(execute=True):
+                response = api_client.delete(f"/api/routes/{first.data['id']}/")
+            assert response.status_code == 204
+
+            second = api_client.post(
+                "/api/routes/", data=data, content_type="application/json"
+            )
+
+        assert second.status_code == 200
+        assert second.data["id"] != first.data["id"]
+        assert Route.objects.filter(id=second.data["id"]).exists()
+        assert mock_get_route.call_count == 2
@@ -1,4 +1,15 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db.models import Max
+from django.db.models.functions import Greatest
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from rest_framework import viewsets, status
 from rest_framework.response import Response
@@ -8,11 +19,61 @@ from rest_framework.permissions import AllowAny
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from .caching import cache_route_page
 from .models import Route
-from .serializers import RouteRequestSerializer, RouteResponseSerializer
-from .services import RoutePlannerService
+from .pagination import RouteCursorPagination
+from .serializers import (
+    RouteRequestSerializer,
+    RouteResponseSerializer,
+    RouteSummarySerializer,
+    route_response_data,
+    route_stops_prefetch,
+)
+from .services import RoutePlannerService, route_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Shared by every request; RoutePlannerService keeps no per-request state
+_PLANNER = RoutePlannerService()
+
+
+def _route_last_modified(request: Request, pk: str = None) -> Optional[datetime]:
+    """
+    Get when a route or any station on it last changed, querying once per request.
+
+    The route detail embeds each stop's live station data, so a station
+    price refresh changes the response even though the route row does not.
+    """
+    if not hasattr(request, "_route_updated_at"):
+        request._route_updated_at = (
+            Route.objects.filter(pk=pk)
+            .annotate(
+                last_modified=Greatest("updated_at", Max("stops__station__updated_at"))
+            )
+            .values_list("last_modified", flat=True)
+            .first()
+        )
+    return request._route_updated_at
+
+
+def _route_etag(request: Request, pk: str = None) -> Optional[str]:
+    """Build a weak ETag for a route from its primary key and last change."""
+    updated_at = _route_last_modified(request, pk)
+    if updated_at is None:
+        return None
+    return f'W/"{pk}-{int(updated_at.timestamp() * 1_000_000)}"'
 
 
+# Unchanged routes are answered with 304 before the page cache is consulted;
+# cached pages are dropped whenever a route changes (see signals.py)
+@method_decorator(
+    condition(etag_func=_route_etag, last_modified_func=_route_last_modified),
+    name="retrieve",
+)
+@method_decorator(cache_route_page(settings.ROUTE_LIST_CACHE_TIMEOUT), name="list")
+@method_decorator(
+    cache_route_page(settings.ROUTE_DETAIL_CACHE_TIMEOUT), name="retrieve"
+)
 class RoutePlannerViewSet(viewsets.ViewSet):
     """
     ViewSet for route planning with optimal fuel stops.
@@ -24,6 +85,15 @@ class RoutePlannerViewSet(viewsets.ViewSet):
     queryset = Route.objects.all()
     serializer_class = RouteRequestSerializer
     permission_classes = [AllowAny]
+    pagination_class = RouteCursorPagination
+
+    # Messages for errors the actions do not handle (see exceptions.py)
+    unexpected_error_messages = {
+        "create": "An unexpected error occurred while planning the route",
+        "list": "An unexpected error occurred while retrieving routes",
+        "retrieve": "An unexpected error occurred while retrieving the route",
+        "destroy": "An unexpected error occurred while deleting the route",
+    }
 
     @swagger_auto_schema(
         # request_body=RouteRequestSerializer,
@@ -47,6 +117,7 @@ class RoutePlannerViewSet(viewsets.ViewSet):
             200: RouteResponseSerializer,
             400: "Invalid input parameters",
             500: "Internal server error",
+            502: "Routing service unavailable",
         },
         operation_description="""
         Calculate a route between two locations with optimal fuel stops.
@@ -74,55 +145,109 @@ class RoutePlannerViewSet(viewsets.ViewSet):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+        # Serve repeated requests for the same trip straight from the cache
+        cache_key = route_cache_key(
+            serializer.validated_data["start_location"],
+            serializer.validated_data["end_location"],
+        )
+        try:
+            cached_response = cache.get(cache_key)
+            if cached_response is not None:
+                return Response(cached_response, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.warning(
+                f"Cache retrieval failed: {str(e)}. Proceeding without cache."
+            )
+
         try:
             # Calculate route
-            route_planner = RoutePlannerService()
-            print(serializer.validated_data, flush=True)
-            route = route_planner.plan_route(
+            # Lazy %-formatting: nothing is formatted unless DEBUG is enabled
+            logger.debug("Planning route: %s", serializer.validated_data)
+            route = _PLANNER.plan_route(
                 serializer.validated_data["start_location"],
                 serializer.validated_data["end_location"],
             )
 
-            # Serialize response
-            response_serializer = RouteResponseSerializer(route)
-            return Response(response_serializer.data, status=status.HTTP_200_OK)
+            # Build the response directly; this is the hot path
+            data = route_response_data(route)
+
+            try:
+                cache.set(cache_key, data, settings.CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(
+                    f"Cache storage failed: {str(e)}. Proceeding without cache."
+                )
+
+            return Response(data, status=status.HTTP_200_OK)
 
         except ValidationError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
+        except requests.RequestException:
             return Response(
-                {"error": "An unexpected error occurred while planning the route"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "The routing service is unavailable, try again later"},
+                status=status.HTTP_502_BAD_GATEWAY,
             )
 
     @swagger_auto_schema(
         responses={
-            200: RouteResponseSerializer(many=True),
+            200: RouteSummarySerializer(many=True),
             500: "Internal server error",
         },
-        operation_description="Retrieve list of all calculated routes",
+        operation_description="""
+        Retrieve calculated routes, newest first, 50 per page.
+
+        Follow the ``next`` and ``previous`` links to page through the list.
+        Pass ``include=polyline`` to also return each route's fuel stops and
+        polyline.
+        """,
         operation_summary="List all routes",
+        manual_parameters=[
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                description="Pagination cursor from a previous page",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "include",
+                openapi.IN_QUERY,
+                description="Set to 'polyline' to include fuel stops and polyline",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
     )
     def list(self, request: Request) -> Response:
         """
-        List all calculated routes.
+        List calculated routes, one page at a time.
+
+        Args:
+            request: HTTP request, optionally carrying ``cursor`` and ``include``
 
         Returns:
-            Response containing all routes in the database
+            Paginated response containing a page of routes
         """
-        try:
-            routes = Route.objects.all().order_by("-created_at")
-            serializer = RouteResponseSerializer(routes, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response(
-                {"error": "An unexpected error occurred while retrieving routes"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        includes = request.query_params.get("include", "").split(",")
+        include_polyline = "polyline" in includes
+        paginator = self.pagination_class()
+
+        if not include_polyline:
+            queryset = Route.objects.only(*RouteSummarySerializer.Meta.fields)
+            routes = paginator.paginate_queryset(queryset, request, view=self)
+            serializer = RouteSummarySerializer(routes, many=True)
+            return paginator.get_paginated_response(serializer.data)
+
+        routes = paginator.paginate_queryset(
+            Route.objects.prefetch_related(route_stops_prefetch()),
+            request,
+            view=self,
+        )
+        serializer = RouteResponseSerializer(routes, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         responses={
             200: RouteResponseSerializer,
+            304: "Route not modified since the ETag or date supplied",
             404: "Route not found",
             500: "Internal server error",
         },
@@ -158,11 +283,6 @@ class RoutePlannerViewSet(viewsets.ViewSet):
                 {"error": f"Route with id {pk} not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        except Exception as e:
-            return Response(
-                {"error": "An unexpected error occurred while retrieving the route"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
 
     @swagger_auto_schema(
         responses={
@@ -202,8 +322,3 @@ class RoutePlannerViewSet(viewsets.ViewSet):
                 {"error": f"Route with id {pk} not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        except Exception as e:
-            return Response(
-                {"error": "An unexpected error occurred while deleting the route"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings.prod")
 
 application = get_asgi_application()
+
+# Load the station index at startup so the first route request does not pay for it
+from route_planner.station_index import station_index  # noqa: E402
+
+station_index.warm()
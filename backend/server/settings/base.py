@@ -68,6 +68,8 @@ CACHES = {
 }
 
 ROUTE_CACHE_TIMEOUT = 86400  # 24 hours in seconds
+ROUTE_LIST_CACHE_TIMEOUT = 60  # seconds
+ROUTE_DETAIL_CACHE_TIMEOUT = 300  # 5 minutes
 
 # configure DRF
 REST_FRAMEWORK = {
@@ -77,9 +79,15 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": (
+        "route_planner.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "EXCEPTION_HANDLER": "route_planner.exceptions.exception_handler",
 }
 
 MIDDLEWARE = [
+    "django.middleware.gzip.GZipMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -181,6 +189,7 @@ MAP_QUEST_URL = "http://www.mapquestapi.com"
 MILES_PER_GALLON = 10
 MAX_RANGE = 500
 CACHE_TIMEOUT = 3600  # 1 hour
+STATION_SEARCH_RADIUS = 10  # miles either side of the route
 
 LOGGING = {
     "version": 1,
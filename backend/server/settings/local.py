@@ -3,3 +3,5 @@ from .base import *
 ALLOWED_HOSTS = ["0.0.0.0", "localhost", "127.0.0.1"]
 
 INTERNAL_IPS = ["127.0.0.1"]
+
+LOGGING["loggers"]["route_planner"]["level"] = "DEBUG"
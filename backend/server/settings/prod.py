@@ -22,3 +22,5 @@ ALLOWED_HOSTS = os.environ.get("ALLOWED_HOST_DNS", "").split(" ")
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 CSRF_TRUSTED_ORIGINS = ["http://localhost:1337"]
+
+LOGGING["loggers"]["route_planner"]["level"] = "INFO"
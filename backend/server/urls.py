@@ -40,17 +40,26 @@ schema_view = get_schema_view(
     permission_classes=(permissions.AllowAny,),
 )
 
+# Building the schema walks every view; serve it from the cache outside development
+SCHEMA_CACHE_TIMEOUT = 0 if settings.DEBUG else 60 * 60
+
 urlpatterns: Iterable[URLResolver | URLPattern] = [
     path("admin/", admin.site.urls),
     path(
-        "swagger<format>/", schema_view.without_ui(cache_timeout=0), name="schema-json"
+        "swagger<format>/",
+        schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT),
+        name="schema-json",
     ),
     path(
         "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
+        schema_view.with_ui("swagger", cache_timeout=SCHEMA_CACHE_TIMEOUT),
         name="schema-swagger-ui",
     ),
-    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    path(
+        "redoc/",
+        schema_view.with_ui("redoc", cache_timeout=SCHEMA_CACHE_TIMEOUT),
+        name="schema-redoc",
+    ),
     path("api/", include("route_planner.urls")),
 ]
 
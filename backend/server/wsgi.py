@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings.local")
 
 application = get_wsgi_application()
+
+# Load the station index at startup so the first route request does not pay for it
+from route_planner.station_index import station_index  # noqa: E402
+
+station_index.warm()